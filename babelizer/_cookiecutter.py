@@ -1,58 +1,104 @@
 from __future__ import annotations
 
+import functools
 import os
 from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
+from jinja2 import BytecodeCache
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 from jinja2 import StrictUndefined
 from jinja2 import Template
 
+from babelizer._datadir import get_cache_dir
 from babelizer._datadir import get_template_dir
 from babelizer._post_hook import run
-from babelizer._utils import as_cwd
+from babelizer._version import __version__
 
 
 def cookiecutter(
     template: str,
     context: dict[str, Any] | None = None,
-    output_dir: str = ".",
-) -> None:
+) -> tuple[dict[str, bytes], dict[str, str]]:
+    """Render a project template in memory.
+
+    Parameters
+    ----------
+    template : str
+        Path to the project template.
+    context : dict, optional
+        Context to use for substitution.
+
+    Returns
+    -------
+    tuple of dict
+        Contents of the rendered files, and the targets of symbolic links,
+        keyed by path relative to the top of the project (with forward
+        slashes).
+    """
     if context is None:
         context = {}
     env = babelizer_environment(template)
 
-    def datetime_format(value: datetime, format_: str = "%Y-%M-%D") -> str:
-        return value.strftime(format_)
-
-    env.filters["datetimeformat"] = datetime_format
-
-    for dirpath, _dirnames, filenames in os.walk(template):
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(template):
+        dirnames.sort()
         rel_path = os.path.relpath(dirpath, template)
-        target_dir = os.path.join(output_dir, render_path(rel_path, context))
-
-        if not os.path.exists(target_dir):
-            os.makedirs(target_dir)
+        target_dir = render_path(rel_path, context)
 
-        for filename in filenames:
+        for filename in sorted(filenames):
+            name = os.path.join(rel_path, filename).replace(os.sep, "/")
             target_path = os.path.join(target_dir, render_path(filename, context))
+            files[os.path.normpath(target_path).replace(os.sep, "/")] = (
+                env.get_template(name).render(**context).encode()
+            )
 
-            with open(target_path, "w") as fp:
-                fp.write(
-                    env.get_template(os.path.join(rel_path, filename)).render(**context)
-                )
+    links = run(files, context)
 
-    with as_cwd(output_dir):
-        run(context)
+    return files, links
 
 
+@functools.lru_cache(maxsize=None)
 def babelizer_environment(template: str | None = None) -> Environment:
     if template is None:
         template = get_template_dir()
 
-    return Environment(loader=FileSystemLoader(template), undefined=StrictUndefined)
+    env = Environment(
+        loader=FileSystemLoader(template),
+        undefined=StrictUndefined,
+        bytecode_cache=_bytecode_cache(),
+    )
+    env.filters["datetimeformat"] = datetime_format
+
+    return env
+
+
+def datetime_format(value: datetime, format_: str = "%Y-%M-%D") -> str:
+    return value.strftime(format_)
+
+
+@functools.lru_cache(maxsize=None)
+def _bytecode_cache() -> BytecodeCache | None:
+    """Get a cache for compiled templates that persists between runs.
+
+    Cached templates are keyed by path and checked against a hash of
+    their source, so an edited template is compiled again. The cache
+    is kept separately for each version of the babelizer.
+    """
+    directory = os.path.join(get_cache_dir(), __version__, "jinja")
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory)
+
+
+@functools.lru_cache(maxsize=None)
+def _path_template(path: str) -> Template:
+    return Template(path, undefined=StrictUndefined)
 
 
 def render_path(
@@ -86,7 +132,7 @@ def render_path(
     ...
     jinja2.exceptions.UndefinedError: 'bar' is undefined
     """
-    rendered_path = Template(path, undefined=StrictUndefined).render(**context)
+    rendered_path = _path_template(path).render(**context)
 
     root, ext = os.path.splitext(rendered_path)
     return rendered_path if ext not in remove_extension else root
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 
 if sys.version_info >= (3, 12):  # pragma: no cover (PY12+)
@@ -14,3 +15,22 @@ def get_datadir() -> str:
 
 def get_template_dir() -> str:
     return str(importlib_resources.files("babelizer") / "data" / "templates")
+
+
+def get_cache_dir() -> str:
+    """Get the folder where the babelizer keeps data between runs.
+
+    Set the ``BABELIZER_CACHE_DIR`` environment variable to use a different
+    folder.
+    """
+    if cache_dir := os.environ.get("BABELIZER_CACHE_DIR"):
+        return cache_dir
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(base, "babelizer")
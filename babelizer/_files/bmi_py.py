@@ -23,29 +23,51 @@ def _render_bmi_c(context: Mapping[str, Any]) -> str:
     language = languages[0]
     assert language in ("c", "c++", "fortran")
 
-    imports = [
-        f"from {context['package']['name']}.lib import {cls}"
-        for cls in context["library"]
-    ]
-
+    package_name = context["package"]["name"]
+    components = [f'    "{cls}": "{package_name}.lib",' for cls in context["library"]]
     names = [f"    {cls!r},".replace("'", '"') for cls in context["library"]]
 
     return f"""\
-{os.linesep.join(sorted(imports))}
+import importlib
 
 __all__ = [
 {os.linesep.join(sorted(names))}
-]\
+]
+
+_MODULES = {{
+{os.linesep.join(sorted(components))}
+}}
+
+
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {{__name__!r}} has no attribute {{name!r}}"
+        ) from None
+
+    cls = getattr(importlib.import_module(module), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))\
 """
 
 
 def _render_bmi_py(context: Mapping[str, Any]) -> str:
-    """Render _bmi.py for a python library."""
+    """Render _bmi.py for a python library.
+
+    A component's library is imported when the component is first used.
+    """
     languages = [library["language"] for library in context["library"].values()]
     language = languages[0]
     assert language == "python"
 
     header = """\
+import importlib
 import sys
 
 if sys.version_info >= (3, 12):  # pragma: no cover (PY12+)
@@ -54,30 +76,40 @@ else:  # pragma: no cover (<PY312)
     import importlib_resources
 """
 
-    imports = [
-        f"from {component['library']} import {component['entry_point']} as {cls}"
+    components = [
+        f'    "{cls}": ("{component["library"]}", "{component["entry_point"]}"),'
         for cls, component in context["library"].items()
     ]
 
-    rename = [
-        f"""\
-{cls}.__name__ = {cls!r}
-{cls}.METADATA = str(importlib_resources.files(__name__) / "data/{cls}")
-""".replace(
-            "'", '"'
-        )
-        for cls in context["library"]
-    ]
-
     names = [f"    {cls!r},".replace("'", '"') for cls in context["library"]]
 
     return f"""\
 {header}
-{os.linesep.join(sorted(imports))}
-
-{os.linesep.join(sorted(rename))}
-
 __all__ = [
 {os.linesep.join(sorted(names))}
-]\
+]
+
+_ENTRY_POINTS = {{
+{os.linesep.join(sorted(components))}
+}}
+
+
+def __getattr__(name):
+    try:
+        library, entry_point = _ENTRY_POINTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {{__name__!r}} has no attribute {{name!r}}"
+        ) from None
+
+    cls = getattr(importlib.import_module(library), entry_point)
+    cls.__name__ = name
+    cls.METADATA = str(importlib_resources.files(__name__) / f"data/{{name}}")
+
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))\
 """
@@ -6,19 +6,44 @@ from typing import Any
 
 
 def render(context: Mapping[str, Any]) -> str:
-    """Render __init__.py."""
-    package_name = context["package"]["name"]
+    """Render __init__.py.
 
-    imports = [f"from {package_name}._version import __version__"]
-    imports += [f"from {package_name}._bmi import {cls}" for cls in context["library"]]
+    Components are imported when they are first used (PEP 562), so
+    importing the package doesn't load any of them.
+    """
+    package_name = context["package"]["name"]
 
+    components = [f'    "{cls}": "{package_name}._bmi",' for cls in context["library"]]
     names = [f"    {cls!r},".replace("'", '"') for cls in context["library"]]
 
     return f"""\
-{os.linesep.join(sorted(imports))}
+import importlib
+
+from {package_name}._version import __version__
 
 __all__ = [
     "__version__",
 {os.linesep.join(sorted(names))}
-]\
+]
+
+_MODULES = {{
+{os.linesep.join(sorted(components))}
+}}
+
+
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {{__name__!r}} has no attribute {{name!r}}"
+        ) from None
+
+    cls = getattr(importlib.import_module(module), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))\
 """
@@ -6,19 +6,44 @@ from typing import Any
 
 
 def render(context: Mapping[str, Any]) -> str:
-    """Render lib/__init__.py."""
-    package_name = context["package"]["name"]
-    imports = [
-        f"from {package_name}.lib.{cls.lower()} import {cls}"
-        for cls in context["library"]
-    ]
+    """Render lib/__init__.py.
 
+    Components are imported when they are first used (PEP 562), so only
+    their own extension is loaded.
+    """
+    if context["build"].get("single_extension", False):
+        modules = dict.fromkeys(context["library"], "_components")
+    else:
+        modules = {cls: cls.lower() for cls in context["library"]}
+
+    components = [f'    "{cls}": "{module}",' for cls, module in modules.items()]
     names = [f"    {cls!r},".replace("'", '"') for cls in context["library"]]
 
     return f"""\
-{os.linesep.join(sorted(imports))}
+import importlib
 
 __all__ = [
 {os.linesep.join(sorted(names))}
-]\
+]
+
+_MODULES = {{
+{os.linesep.join(sorted(components))}
+}}
+
+
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {{__name__!r}} has no attribute {{name!r}}"
+        ) from None
+
+    cls = getattr(importlib.import_module(f".{{module}}", __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))\
 """
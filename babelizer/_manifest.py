@@ -0,0 +1,102 @@
+"""Write a babelized project, touching only the files whose contents changed.
+
+Whether a file has changed is decided by comparing it with the file on disk.
+"""
+
+from __future__ import annotations
+
+import difflib
+import os
+from collections.abc import Iterator
+from collections.abc import Mapping
+
+
+def sync_files(
+    files: Mapping[str, bytes], dst: str, links: Mapping[str, str] | None = None
+) -> set[str]:
+    """Write files to a folder, skipping those that are already up to date.
+
+    Files in *dst* whose contents already match are left untouched, so
+    their modification times (and any build that depends on them) are
+    unaffected. Files that are only in *dst* are kept, as are existing
+    files in place of a symbolic link.
+
+    Parameters
+    ----------
+    files : dict
+        File contents, keyed by path relative to *dst*.
+    dst : str
+        Path to the destination folder, which is created if needed.
+    links : dict, optional
+        Targets of symbolic links, keyed by path relative to *dst*.
+
+    Returns
+    -------
+    set of str
+        Paths, relative to *dst*, of the files that were written.
+    """
+    written = set()
+
+    os.makedirs(dst, exist_ok=True)
+    for rel_path, contents in sorted(files.items()):
+        path = os.path.join(dst, rel_path)
+        if _read_bytes(path) == contents:
+            continue
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as fp:
+            fp.write(contents)
+        written.add(rel_path)
+
+    for rel_path, target in sorted((links or {}).items()):
+        path = os.path.join(dst, rel_path)
+        if not os.path.lexists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.symlink(target, path, target_is_directory=True)
+
+    return written
+
+
+def diff_files(files: Mapping[str, bytes], root: str) -> Iterator[str]:
+    """Compare files with those in a folder, as a unified diff.
+
+    Only files in *files* are compared; files that are only in *root* are
+    ignored.
+
+    Parameters
+    ----------
+    files : dict
+        File contents, keyed by path relative to *root*.
+    root : str
+        Path to the folder.
+
+    Yields
+    ------
+    str
+        Lines of the diff that would turn the folder's files into *files*.
+    """
+    for rel_path, contents in sorted(files.items()):
+        current = _read_bytes(os.path.join(root, rel_path))
+        if current == contents:
+            continue
+
+        fromfile = "/dev/null" if current is None else f"a/{rel_path}"
+        try:
+            old = [] if current is None else current.decode().splitlines(True)
+            new = contents.decode().splitlines(True)
+        except UnicodeDecodeError:
+            yield f"Binary files {fromfile} and b/{rel_path} differ\n"
+            continue
+
+        for line in difflib.unified_diff(old, new, fromfile, f"b/{rel_path}"):
+            if not line.endswith("\n"):
+                line += "\n\\ No newline at end of file\n"
+            yield line
+
+
+def _read_bytes(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as fp:
+            return fp.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
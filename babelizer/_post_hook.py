@@ -1,85 +1,77 @@
 from __future__ import annotations
 
-import errno
+import hashlib
+import importlib.metadata
 import os
+import posixpath
 import re
+import tempfile
 from collections import defaultdict
 from collections.abc import Iterable
-from pathlib import Path
+from collections.abc import MutableMapping
+from contextlib import suppress
 from typing import Any
 
-from logoizer import logoize
+from babelizer._datadir import get_cache_dir
 
-# PROJECT_DIRECTORY = Path.cwd().resolve()
 
+def clean_folder(
+    files: MutableMapping[str, bytes], folder: str, keep: Iterable[str] = ()
+) -> None:
+    """Remove the files in a folder (but not its subfolders) not in *keep*."""
+    keep = {posixpath.join(folder, name) for name in keep}
+    for path in list(files):
+        if posixpath.dirname(path) == folder and path not in keep:
+            del files[path]
 
-# def remove_file(filepath: Path) -> None:
-#     filepath.unlink(filepath)
-#     # (PROJECT_DIRECTORY / filepath).unlink(filepath)
 
-
-# def remove_folder(folderpath):
-#     shutil.rmtree(PROJECT_DIRECTORY / folderpath)
-
-
-# def make_folder(folderpath):
-#     try:
-#         # (PROJECT_DIRECTORY / folderpath).mkdir(parents=True, exist_ok=True)
-#         folderpath.mkdir(parents=True, exist_ok=True)
-#     except OSError:
-#         pass
-
-
-def clean_folder(folderpath: Path, keep: Iterable[str | Path] = ()) -> None:
-    keep = {str((folderpath / path).resolve()) for path in keep}
-    # if keep:
-    #     keep = set([str((folderpath / path).resolve()) for path in keep])
-    # else:
-    #     keep = set()
-
-    # folderpath = PROJECT_DIRECTORY / folderpath
-    for fname in folderpath.glob("*"):
-        if not fname.is_dir() and str(fname.resolve()) not in keep:
-            fname.unlink()
-
-    try:
-        folderpath.rmdir()
-    except OSError as err:
-        if err.errno != errno.ENOTEMPTY:
-            raise
-
-
-def split_file(filepath: Path, include_preamble: bool = False) -> set[str]:
-    filepath = Path(filepath)
+def split_file(
+    files: MutableMapping[str, bytes], path: str, include_preamble: bool = False
+) -> set[str]:
+    """Split a file into new files at ``# start: <name>`` lines."""
     SPLIT_START_REGEX = re.compile(r"\s*#\s*start:\s*(?P<fname>\S+)\s*")
 
-    files = defaultdict(list)
+    sections = defaultdict(list)
     fname = "preamble"
-    with open(filepath) as fp:
-        for line in fp:
-            m = SPLIT_START_REGEX.match(line)
-            if m:
-                fname = m["fname"]
-            files[fname].append(line)
-
-    preamble = files.pop("preamble")
-    folderpath = filepath.parent
-    for name, contents in files.items():
-        with open(folderpath / name, "w") as fp:
-            if include_preamble:
-                fp.write("".join(preamble))
-            print("".join(contents).strip(), file=fp)
-            # fp.write("".join(contents).strip())
-
-    return set(files)
-
-
-def write_api_yaml(folderpath: Path, **kwds: str) -> Path:
-    # make_folder(folderpath)
-    os.makedirs(folderpath, exist_ok=True)
-
-    # api_yaml = PROJECT_DIRECTORY / folderpath / "api.yaml"
-    api_yaml = folderpath / "api.yaml"
+    for line in files[path].decode().splitlines(keepends=True):
+        m = SPLIT_START_REGEX.match(line)
+        if m:
+            fname = m["fname"]
+        sections[fname].append(line)
+
+    preamble = "".join(sections.pop("preamble")) if include_preamble else ""
+    folder = posixpath.dirname(path)
+    for name, contents in sections.items():
+        files[posixpath.join(folder, name)] = (
+            preamble + "".join(contents).strip() + "\n"
+        ).encode()
+
+    return set(sections)
+
+
+def write_component_modules(
+    files: MutableMapping[str, bytes], folder: str, classes: Iterable[str]
+) -> set[str]:
+    """Write a module for each component that is built into a single extension.
+
+    The modules import their component from the ``_components`` extension
+    so they can be imported just as if each were its own extension.
+    """
+    names = set()
+    for cls in classes:
+        name = f"{cls.lower()}.py"
+        contents = f"""\
+from ._components import {cls}
+
+__all__ = ["{cls}"]
+"""
+        files[posixpath.join(folder, name)] = contents.encode()
+        names.add(name)
+    return names
+
+
+def write_api_yaml(files: MutableMapping[str, bytes], folder: str, **kwds: str) -> str:
+    api_yaml = posixpath.join(folder, "api.yaml")
     contents = """\
 name: {package_name}
 language: {language}
@@ -88,45 +80,110 @@ class: {plugin_class}
 """.format(
         **kwds
     )
-    with open(api_yaml, "w") as fp:
-        fp.write(contents)
+    files[api_yaml] = contents.encode()
 
     return api_yaml
 
 
-def remove_trailing_whitespace(path: str | Path) -> None:
-    with open(path) as fp:
-        lines = [line.rstrip() for line in fp]
-    with open(path, "w") as fp:
-        print(os.linesep.join(lines), file=fp)
+def remove_trailing_whitespace(contents: str) -> str:
+    return "\n".join(line.rstrip() for line in contents.splitlines()) + "\n"
+
+
+def make_logo(words: str, dest: str, light: bool = True) -> None:
+    """Draw a logo on a new figure (logoize draws on the current one)."""
+    from logoizer import logoize
+    from matplotlib import pyplot as plt
+
+    plt.figure()
+    try:
+        logoize(words, dest, light=light)
+    finally:
+        plt.close()
+
+
+def remove_svg_date(contents: str) -> str:
+    """Remove the creation date from an svg so renders are reproducible."""
+    return re.sub(r"\s*<dc:date>.*?</dc:date>", "", contents)
 
 
-def run(context: dict[str, Any]) -> None:
-    PROJECT_DIRECTORY = Path.cwd().resolve()
+def get_logo(words: str, light: bool = True) -> bytes:
+    """Get a logo, reusing one drawn by an earlier render if possible.
 
+    Logos are cached by their words and the version of logoizer that drew
+    them.
+    """
+    variant = "light" if light else "dark"
+    digest = hashlib.sha256(words.encode()).hexdigest()[:16]
+    cached = os.path.join(_logo_cache_dir(), f"{digest}-{variant}.svg")
+
+    with suppress(OSError), open(cached, "rb") as fp:
+        return fp.read()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        make_logo(words, os.path.join(tmpdir, "logo.svg"), light=light)
+        with open(os.path.join(tmpdir, "logo.svg")) as fp:
+            logo = remove_trailing_whitespace(remove_svg_date(fp.read())).encode()
+
+    with suppress(OSError):
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(suffix=".svg", dir=os.path.dirname(cached))
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(logo)
+        os.replace(tmp, cached)
+
+    return logo
+
+
+def _logo_cache_dir() -> str:
+    try:
+        version = importlib.metadata.version("logoizer")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return os.path.join(get_cache_dir(), "logos", f"logoizer-{version}")
+
+
+def run(files: MutableMapping[str, bytes], context: dict[str, Any]) -> dict[str, str]:
+    """Finish a rendered project.
+
+    Parameters
+    ----------
+    files : dict
+        Contents of the rendered files, keyed by path relative to the top
+        of the project (with forward slashes). Files are added and removed
+        in place.
+    context : dict
+        Context used to render the project.
+
+    Returns
+    -------
+    dict
+        Symbolic links to add to the project, as their targets keyed by path.
+    """
     package_name = context["package"]["name"]
     language = context["language"]
 
-    LIB_DIRECTORY = PROJECT_DIRECTORY / Path(package_name, "lib")
+    lib_directory = posixpath.join(package_name, "lib")
 
     keep = set()
 
-    static_dir = PROJECT_DIRECTORY / "docs" / "_static"
-    # make_folder(PROJECT_DIRECTORY / static_dir)
-    os.makedirs(PROJECT_DIRECTORY / static_dir, exist_ok=True)
-
-    logoize(package_name, static_dir / "logo-light.svg", light=True)
-    logoize(package_name, static_dir / "logo-dark.svg", light=False)
-
-    remove_trailing_whitespace(static_dir / "logo-dark.svg")
-    remove_trailing_whitespace(static_dir / "logo-light.svg")
+    static_dir = posixpath.join("docs", "_static")
+    files[posixpath.join(static_dir, "logo-light.svg")] = get_logo(
+        package_name, light=True
+    )
+    files[posixpath.join(static_dir, "logo-dark.svg")] = get_logo(
+        package_name, light=False
+    )
 
     if language == "c":
         keep |= {"__init__.py", "bmi.c", "bmi.h"}
-        keep |= split_file(LIB_DIRECTORY / "_c.pyx", include_preamble=True)
+        keep |= split_file(
+            files, posixpath.join(lib_directory, "_c.pyx"), include_preamble=True
+        )
     elif language == "c++":
         keep |= {"__init__.py", "bmi.hxx"}
-        keep |= split_file(LIB_DIRECTORY / "_cxx.pyx", include_preamble=True)
+        keep |= split_file(
+            files, posixpath.join(lib_directory, "_cxx.pyx"), include_preamble=True
+        )
     elif language == "fortran":
         keep |= {
             "__init__.py",
@@ -134,22 +191,28 @@ def run(context: dict[str, Any]) -> None:
             "bmi_interoperability.f90",
             "bmi_interoperability.h",
         }
-        keep |= split_file(LIB_DIRECTORY / "_fortran.pyx", include_preamble=True)
+        keep |= split_file(
+            files, posixpath.join(lib_directory, "_fortran.pyx"), include_preamble=True
+        )
 
-    clean_folder(LIB_DIRECTORY, keep=keep)
+    if context["single_extension"]:
+        keep |= write_component_modules(files, lib_directory, context["components"])
+
+    clean_folder(files, lib_directory, keep=keep)
 
     if language == "python":
-        os.remove(PROJECT_DIRECTORY / "meson.build")
+        del files["meson.build"]
 
-    datadir = Path("meta")
-    package_datadir = Path(package_name) / "data"
-    if not package_datadir.exists():
-        package_datadir.symlink_to(".." / datadir, target_is_directory=True)
+    datadir = "meta"
+    links = {posixpath.join(package_name, "data"): posixpath.join("..", datadir)}
 
     for babelized_class in context["components"]:
         write_api_yaml(
-            PROJECT_DIRECTORY / datadir / babelized_class,
+            files,
+            posixpath.join(datadir, babelized_class),
             language=language,
             plugin_class=babelized_class,
             package_name=package_name,
         )
+
+    return links
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import ast
 import os
 import pathlib
+import re
 import subprocess
 import sys
 from collections.abc import Generator
@@ -16,6 +18,11 @@ from typing import Any
 from babelizer.errors import SetupPyError
 from babelizer.errors import ValidationError
 
+if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
+    import tomllib
+else:  # pragma: no cover (<PY311)
+    import tomli as tomllib
+
 
 def execute(args: Sequence[str]) -> subprocess.CompletedProcess[bytes]:
     """Run a command through the ``subprocess`` module.
@@ -71,28 +78,88 @@ def get_setup_py_version() -> str | None:
         return None
 
 
-@contextmanager
-def save_files(files: Iterable[str]) -> Generator[dict[str, str], None, None]:
-    """Generate repository files through a context.
+def get_package_version(package_name: str, use_setup_py: bool = False) -> str | None:
+    """Get babelized package version without building the package.
+
+    The version is read, in order, from the package's ``_version.py``
+    file, the ``[project]`` table of ``pyproject.toml``, and the
+    most recent release tag of the git repository (e.g. ``v1.2.3``).
 
     Parameters
     ----------
-    files : list of str
-        List of path-like objects.
+    package_name : str
+        Name of the babelized package.
+    use_setup_py : bool, optional
+        If the version can't be found, ask ``python setup.py`` for it.
+
+    Returns
+    -------
+    str or None
+        Package version.
 
-    Yields
+    Raises
     ------
-    str
-        Generator for repository files.
+    SetupPyError
+        If calling ``python setup.py`` raises an exception.
     """
-    contents = {}
-    for file_ in files:
-        with suppress(FileNotFoundError), open(file_) as fp:
-            contents[file_] = fp.read()
-    yield contents
-    for file_ in contents:
-        with open(file_, "w") as fp:
-            fp.write(contents[file_])
+    version = (
+        _read_version_py(pathlib.Path(package_name, "_version.py"))
+        or _read_pyproject_version(pathlib.Path("pyproject.toml"))
+        or _read_git_tag_version(pathlib.Path(".git"))
+    )
+    if version is None and use_setup_py:
+        version = get_setup_py_version()
+    return version
+
+
+def _read_version_py(path: pathlib.Path) -> str | None:
+    try:
+        tree = ast.parse(path.read_text(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == "__version__"
+                for target in node.targets
+            )
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            return node.value.value
+    return None
+
+
+def _read_pyproject_version(path: pathlib.Path) -> str | None:
+    try:
+        with open(path, "rb") as fp:
+            project = tomllib.load(fp).get("project", {})
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
+
+    version = project.get("version")
+    return version if isinstance(version, str) else None
+
+
+def _read_git_tag_version(git_dir: pathlib.Path) -> str | None:
+    tags = set()
+    with suppress(OSError):
+        for path in (git_dir / "refs" / "tags").rglob("*"):
+            tags.add(path.relative_to(git_dir / "refs" / "tags").as_posix())
+    with suppress(OSError), open(git_dir / "packed-refs") as fp:
+        for line in fp:
+            _, _, ref = line.strip().partition(" ")
+            if ref.startswith("refs/tags/"):
+                tags.add(ref[len("refs/tags/") :])
+
+    releases = {}
+    for tag in tags:
+        if m := re.fullmatch(r"v?(?P<version>\d+(\.\d+)*)", tag):
+            releases[tuple(int(n) for n in m["version"].split("."))] = m["version"]
+
+    return releases[max(releases)] if releases else None
 
 
 @contextmanager
@@ -106,8 +173,10 @@ def as_cwd(path: str) -> Generator[None, None, None]:
     """
     prev_cwd = os.getcwd()
     os.chdir(path)
-    yield
-    os.chdir(prev_cwd)
+    try:
+        yield
+    finally:
+        os.chdir(prev_cwd)
 
 
 def parse_entry_point(specifier: str) -> tuple[str, str, str]:
@@ -6,27 +6,29 @@ import fnmatch
 import io
 import os
 import pathlib
-import tempfile
+import sys
+from collections.abc import Callable
 from collections.abc import Collection
 from functools import partial
+from typing import Any
 from typing import cast
 
 import click
-import git
 
 from babelizer._datadir import get_template_dir
 from babelizer._files.gitignore import render as render_gitignore
 from babelizer._files.license_rst import render as render_license
 from babelizer._files.meson_build import render as render_meson_build
-from babelizer._files.readme import render as render_readme
-from babelizer._utils import get_setup_py_version
-from babelizer._utils import save_files
+from babelizer._manifest import diff_files
+from babelizer._manifest import sync_files
+from babelizer._utils import as_cwd
+from babelizer._utils import get_package_version
 from babelizer.config import BabelConfig
+from babelizer.errors import BabelizeError
 from babelizer.errors import OutputDirExistsError
 from babelizer.errors import ScanError
 from babelizer.errors import SetupPyError
 from babelizer.errors import ValidationError
-from babelizer.render import render
 
 out = partial(click.secho, bold=True, err=True)
 err = partial(click.secho, fg="red", err=True)
@@ -94,16 +96,8 @@ def init(
     except (ScanError, ValidationError) as error:
         raise BabelizerAbort(str(error))
 
-    output = babel_config["package"]["name"]
-
     try:
-        new_folder = render(
-            babel_config,
-            output,
-            template=template,
-            clobber=False,
-            version=package_version,
-        )
+        new_folder = _init_package(babel_config, template, package_version)
     except (ValidationError, OutputDirExistsError) as error:
         raise BabelizerAbort(str(error))
 
@@ -113,10 +107,6 @@ def init(
             f" {os.path.join(new_folder, 'meta')}"
         )
 
-    repo = git.Repo(new_folder)
-    repo.git.add("--all")
-    repo.index.commit("Initial commit")
-
     print(new_folder)
 
 
@@ -141,20 +131,28 @@ def init(
 @click.option(
     "--set-version", default=None, help="Set the version of the updated package"
 )
+@click.option(
+    "--use-setup-py",
+    is_flag=True,
+    help="If the version can't be read from the project, ask setup.py for it",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Print the changes an update would make, as a diff, without making them",
+)
 def update(
-    template: str | None, quiet: bool, verbose: bool, set_version: str | None
+    template: str | None,
+    quiet: bool,
+    verbose: bool,
+    set_version: str | None,
+    use_setup_py: bool,
+    dry_run: bool,
 ) -> None:
     """Update an existing babelized project."""
 
     package_path = os.path.realpath(".")
-    for fname in ("babel.toml", "babel.yaml", "plugin.yaml"):
-        # if (package_path / fname).is_file():
-        #     config_path = package_path / fname
-        if os.path.isfile(os.path.join(package_path, fname)):
-            config_path = os.path.join(package_path, fname)
-            break
-    else:
-        config_path = None
+    config_path = _find_config(package_path)
 
     if not config_path:
         err("this does not appear to be a babelized folder (missing 'babel.toml')")
@@ -171,37 +169,26 @@ def update(
         raise BabelizerAbort(str(error))
 
     try:
-        version = set_version or get_setup_py_version()
-    except SetupPyError as error:
-        raise BabelizerAbort(
-            os.linesep.join(
-                [
-                    "the setup.py of this package has an error:",
-                    f"{error}"
-                    "unable to get package's version. Try using the '--set-version' option",
-                ]
-            )
+        version = _get_version(
+            set_version, babel_config["package"]["name"], use_setup_py=use_setup_py
         )
-    version = "0.1.0" if version is None else version
+    except SetupPyError as error:
+        raise BabelizerAbort(str(error))
 
-    out(f"re-rendering {package_path}")
-    with save_files(["CHANGES.rst", "CREDITS.rst"]):
-        render(
-            babel_config,
-            os.path.dirname(package_path),
-            # package_path.parent,
-            template=template,
-            clobber=True,
-            version=version,
+    if dry_run:
+        files, _, generated_files = _render_update(
+            package_path, babel_config, template, version
         )
+        sys.stdout.writelines(diff_files(files, package_path))
+        extra_files = _extra_files(package_path, generated_files)
+        if extra_files:
+            out(f"found extra files in {package_path}:")
+            for name in sorted(extra_files):
+                out(f"  {name}")
+        return
 
-    extra_files = _repo_contents(package_path) - _generated_files(
-        babel_config, template=template, version=version
-    )
-
-    ignore = ["meta*", "notebooks*", "docs*", "**/data"]
-    for pattern in ignore:
-        extra_files.difference_update(fnmatch.filter(extra_files, pattern))
+    out(f"re-rendering {package_path}")
+    _, extra_files = _update_package(package_path, babel_config, template, version)
 
     if extra_files:
         out(f"found extra files in {package_path}:")
@@ -217,6 +204,97 @@ def update(
     print(package_path)
 
 
+@babelize.command()
+@click.option(
+    "--template",
+    default=None,
+    help="Location of templates",
+)
+@click.option(
+    "--package-version",
+    default="0.1",
+    help="The initial version of the babelized packages",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of packages to render at once [default: number of CPUs]",
+)
+@click.argument(
+    "meta", nargs=-1, type=click.Path(exists=True, dir_okay=False, readable=True)
+)
+def init_many(
+    meta: tuple[str, ...], template: str | None, package_version: str, jobs: int | None
+) -> None:
+    """Initialize many babelized projects at once.
+
+    META are babelizer configuration files. Each project is created in the
+    current directory.
+    """
+    template = template or get_template_dir()
+
+    summaries = _run_many(
+        partial(_init_one, template=template, version=package_version),
+        [os.path.realpath(path) for path in meta],
+        jobs=jobs,
+    )
+    _print_summaries(summaries)
+
+
+@babelize.command()
+@click.option(
+    "--template",
+    default=None,
+    help="Location of templates",
+)
+@click.option(
+    "--set-version", default=None, help="Set the version of the updated packages"
+)
+@click.option(
+    "--use-setup-py",
+    is_flag=True,
+    help="If the version can't be read from the project, ask setup.py for it",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of packages to render at once [default: number of CPUs]",
+)
+@click.argument("package", nargs=-1, type=click.Path(exists=True, readable=True))
+def update_many(
+    package: tuple[str, ...],
+    template: str | None,
+    set_version: str | None,
+    use_setup_py: bool,
+    jobs: int | None,
+) -> None:
+    """Update many babelized projects at once.
+
+    PACKAGE are babelized project folders, or their babel.toml files.
+    """
+    template = template or get_template_dir()
+
+    package_paths = [
+        os.path.dirname(path) if os.path.isfile(path) else path
+        for path in (os.path.realpath(p) for p in package)
+    ]
+    summaries = _run_many(
+        partial(
+            _update_one,
+            template=template,
+            set_version=set_version,
+            use_setup_py=use_setup_py,
+        ),
+        package_paths,
+        jobs=jobs,
+    )
+    _print_summaries(summaries)
+
+
 @babelize.command()
 def sample_config() -> None:
     """Generate the babelizer configuration file."""
@@ -288,40 +366,187 @@ def sample_readme() -> None:
         },
         "package": {"name": "springfield_monorail"},
     }
+    from babelizer._files.readme import render as render_readme
+
     print(render_readme(context))
 
 
-def _get_dir_contents(base: str, trunk: str | None = None) -> set[str]:
-    files = set()
-    for item in os.listdir(base):
-        if os.path.isdir(item):
-            files |= _get_dir_contents(item, trunk=trunk)
+def _find_config(package_path: str) -> str | None:
+    for fname in ("babel.toml", "babel.yaml", "plugin.yaml"):
+        if os.path.isfile(os.path.join(package_path, fname)):
+            return os.path.join(package_path, fname)
+    return None
+
+
+def _get_version(
+    set_version: str | None, package_name: str, use_setup_py: bool = False
+) -> str:
+    try:
+        version = set_version or get_package_version(
+            package_name, use_setup_py=use_setup_py
+        )
+    except SetupPyError as error:
+        raise SetupPyError(
+            os.linesep.join(
+                [
+                    "the setup.py of this package has an error:",
+                    f"{error}"
+                    "unable to get package's version. Try using the '--set-version' option",
+                ]
+            )
+        ) from error
+    return "0.1.0" if version is None else version
+
+
+def _init_package(babel_config: BabelConfig, template: str, version: str) -> str:
+    import git
+
+    from babelizer.render import render
+
+    new_folder = render(
+        babel_config,
+        babel_config["package"]["name"],
+        template=template,
+        clobber=False,
+        version=version,
+    )
+
+    repo = git.Repo(new_folder)
+    repo.git.add("--all")
+    repo.index.commit("Initial commit")
+
+    return new_folder
+
+
+def _render_update(
+    package_path: str, babel_config: BabelConfig, template: str, version: str
+) -> tuple[dict[str, bytes], dict[str, str], set[str]]:
+    """Render a project in memory, leaving out files its authors maintain.
+
+    Returns the files and symbolic links to write, along with the paths of
+    everything that was generated.
+    """
+    from babelizer.render import render_files
+
+    files, links = render_files(babel_config, template=template, version=version)
+    generated_files = set(files) | set(links)
+
+    for name in ("CHANGES.rst", "CREDITS.rst"):
+        if os.path.exists(os.path.join(package_path, name)):
+            files.pop(name, None)
+
+    return files, links, generated_files
+
+
+def _update_package(
+    package_path: str, babel_config: BabelConfig, template: str, version: str
+) -> tuple[set[str], set[str]]:
+    """Re-render a project, returning the files that changed and extra files."""
+    files, links, generated_files = _render_update(
+        package_path, babel_config, template, version
+    )
+    changed_files = sync_files(files, package_path, links=links)
+
+    return changed_files, _extra_files(package_path, generated_files)
+
+
+def _extra_files(package_path: str, generated_files: set[str]) -> set[str]:
+    extra_files = _repo_contents(package_path) - generated_files
+
+    ignore = ["meta*", "notebooks*", "docs*", "**/data"]
+    for pattern in ignore:
+        extra_files.difference_update(fnmatch.filter(extra_files, pattern))
+
+    return extra_files
+
+
+def _init_one(config_path: str, template: str, version: str) -> dict[str, Any]:
+    summary: dict[str, Any] = {"package": config_path}
+    try:
+        babel_config = BabelConfig.from_path(config_path)
+        summary["package"] = _init_package(babel_config, template, version)
+    except Exception as error:
+        summary["error"] = _format_error(error)
+    return summary
+
+
+def _update_one(
+    package_path: str,
+    template: str,
+    set_version: str | None,
+    use_setup_py: bool = False,
+) -> dict[str, Any]:
+    summary: dict[str, Any] = {"package": package_path}
+    try:
+        config_path = _find_config(package_path)
+        if not config_path:
+            raise ValidationError(
+                "this does not appear to be a babelized folder (missing 'babel.toml')"
+            )
+        babel_config = BabelConfig.from_path(config_path)
+        with as_cwd(package_path):
+            version = _get_version(
+                set_version,
+                babel_config["package"]["name"],
+                use_setup_py=use_setup_py,
+            )
+        changed, extra = _update_package(package_path, babel_config, template, version)
+    except Exception as error:
+        summary["error"] = _format_error(error)
+    else:
+        summary["changed"] = sorted(changed)
+        summary["extra"] = sorted(extra)
+    return summary
+
+
+def _format_error(error: Exception) -> str:
+    if isinstance(error, BabelizeError):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+def _run_many(
+    func: Callable[[str], dict[str, Any]], items: list[str], jobs: int | None = None
+) -> list[dict[str, Any]]:
+    """Run a function over items in a process pool, keeping their order."""
+    if jobs == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(func, items))
+
+
+def _print_summaries(summaries: list[dict[str, Any]]) -> None:
+    failed = 0
+    for summary in summaries:
+        if error := summary.get("error"):
+            failed += 1
+            err(f"{summary['package']}: error: {error}")
+            continue
+
+        if "changed" in summary:
+            print(f"{summary['package']}: {len(summary['changed'])} files changed")
         else:
-            files.add(os.path.relpath(item, start=trunk))
+            print(f"{summary['package']}: created")
+        for name in summary.get("extra", []):
+            print(f"  extra file: {name}")
 
-    return files
+    if failed:
+        err(f"{failed} of {len(summaries)} packages failed")
+        sys.exit(1)
 
 
 def _repo_contents(base: str) -> set[str]:
+    import git
+
     repo = git.Repo(base)
     return set(
         repo.git.ls_tree("--full-tree", "-r", "--name-only", "HEAD").splitlines()
     )
 
 
-def _generated_files(
-    babel_config: BabelConfig, template: str | None = None, version: str = "0.1"
-) -> set[str]:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        new_folder = render(
-            babel_config,
-            tmpdir,
-            template=template,
-            version=version,
-        )
-        return _get_dir_contents(new_folder, trunk=new_folder)
-
-
 SAMPLE_CONFIG = """\
 # See https://babelizer.readthedocs.io/ for more information
 
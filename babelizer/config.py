@@ -13,9 +13,6 @@ from collections.abc import Mapping
 from contextlib import suppress
 from typing import Any
 
-import tomli_w
-import yaml
-
 if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
     import tomllib
 else:  # pragma: no cover (<PY311)
@@ -27,14 +24,64 @@ from babelizer.errors import ScanError
 from babelizer.errors import ValidationError
 
 
+def _load_yaml(contents: str) -> Any:
+    import yaml
+
+    try:
+        return yaml.safe_load(contents)
+    except yaml.scanner.ScannerError as error:
+        raise ScanError(f"unable to scan yaml-formatted config file:\n{error}")
+
+
 class BabelConfig(Mapping[str, Any]):
     """Babelizer configuration."""
 
     LOADERS: dict[str, Callable[[str], dict[str, Any]]] = {
-        "yaml": yaml.safe_load,
+        "yaml": _load_yaml,
         "toml": tomllib.loads,
     }
 
+    # Keys added by norm that are not part of a configuration file.
+    DERIVED_KEYS: tuple[str, ...] = ("components", "language")
+
+    # Compiler settings for each of the build profiles.
+    BUILD_PROFILES: dict[str, dict[str, Any]] = {
+        "release": {"buildtype": "release", "ndebug": True, "lto": True},
+        "native": {
+            "buildtype": "release",
+            "ndebug": True,
+            "lto": True,
+            "native": True,
+        },
+        "debug": {"buildtype": "debug", "ndebug": False, "lto": False},
+    }
+    # Cython compiler directives for each of the presets.
+    CYTHON_PRESETS: dict[str, dict[str, bool]] = {
+        "default": {},
+        "fast": {
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+            "initializedcheck": False,
+            "nonecheck": False,
+        },
+    }
+    CYTHON_DIRECTIVES: tuple[str, ...] = (
+        "boundscheck",
+        "wraparound",
+        "cdivision",
+        "initializedcheck",
+        "nonecheck",
+        "overflowcheck",
+    )
+    BUILD_TYPES: tuple[str, ...] = (
+        "plain",
+        "debug",
+        "debugoptimized",
+        "release",
+        "minsize",
+    )
+
     def __init__(
         self,
         library: dict[str, Any] | None = None,
@@ -113,13 +160,15 @@ class BabelConfig(Mapping[str, Any]):
 
         try:
             meta = loader(stream.read())
-        except yaml.scanner.ScannerError as error:
-            raise ScanError(f"unable to scan yaml-formatted config file:\n{error}")
         except tomllib.TOMLDecodeError as error:
             raise ScanError(f"unable to scan toml-formatted config file:\n{error}")
         else:
             if not isinstance(meta, dict):
                 raise ValidationError("config file does not contain a mapping object")
+
+        for key in BabelConfig.DERIVED_KEYS:
+            meta.pop(key, None)
+
         return cls(**meta)
 
     @classmethod
@@ -165,12 +214,16 @@ class BabelConfig(Mapping[str, Any]):
                 except ValidationError:
                     raise ValidationError(f"poorly-formed entry point ({entry_point})")
         else:
-            for _babelized_class, library in libraries.items():
+            for babelized_class, library in libraries.items():
                 validate_dict_keys(
                     library,
                     required={"language", "library", "header", "entry_point"},
-                    optional={},
+                    optional={"nogil"},
                 )
+                if not isinstance(library.get("nogil", False), bool):
+                    raise ValidationError(
+                        f"{babelized_class}: nogil must be either true or false"
+                    )
 
         validate_dict_keys(
             config["build"],
@@ -182,8 +235,25 @@ class BabelConfig(Mapping[str, Any]):
                 "library_dirs",
                 "include_dirs",
                 "extra_compile_args",
+                "profile",
+                "cython",
+                "single_extension",
             ),
         )
+        if "single_extension" in config["build"]:
+            BabelConfig._validate_single_extension(
+                config["build"]["single_extension"],
+                (
+                    {libraries["language"]}
+                    if "entry_point" in libraries
+                    else {library["language"] for library in libraries.values()}
+                ),
+            )
+        if "profile" in config["build"]:
+            BabelConfig._validate_build_profile(config["build"]["profile"])
+        if "cython" in config["build"]:
+            BabelConfig._validate_cython_directives(config["build"]["cython"])
+
         validate_dict_keys(
             config["package"], required=("name", "requirements"), optional={}
         )
@@ -217,6 +287,65 @@ class BabelConfig(Mapping[str, Any]):
                 "use 'package' instead of 'plugin'", DeprecationWarning, stacklevel=2
             )
 
+    @staticmethod
+    def _validate_build_profile(profile: str | dict[str, Any]) -> None:
+        if isinstance(profile, str):
+            profile = {"name": profile}
+        if not isinstance(profile, dict):
+            raise ValidationError("build.profile must be a profile name or a table")
+
+        validate_dict_keys(
+            profile,
+            required=("name",),
+            optional=("buildtype", "ndebug", "lto", "native"),
+        )
+        if profile["name"] not in BabelConfig.BUILD_PROFILES:
+            raise ValidationError(
+                f"build.profile: unknown profile ({profile['name']}), must be one of"
+                f" {', '.join(sorted(BabelConfig.BUILD_PROFILES))}"
+            )
+        if profile.get("buildtype", "release") not in BabelConfig.BUILD_TYPES:
+            raise ValidationError(
+                f"build.profile: unknown buildtype ({profile['buildtype']}), must be"
+                f" one of {', '.join(BabelConfig.BUILD_TYPES)}"
+            )
+        for key in ("ndebug", "lto", "native"):
+            if not isinstance(profile.get(key, False), bool):
+                raise ValidationError(
+                    f"build.profile: {key} must be either true or false"
+                )
+
+    @staticmethod
+    def _validate_single_extension(single: bool, languages: set[str]) -> None:
+        if not isinstance(single, bool):
+            raise ValidationError("build.single_extension must be either true or false")
+        if single and not languages <= {"c", "c++"}:
+            raise ValidationError(
+                "build.single_extension: only c and c++ libraries can be built"
+                " as a single extension"
+            )
+
+    @staticmethod
+    def _validate_cython_directives(cython: str | dict[str, Any]) -> None:
+        if isinstance(cython, str):
+            cython = {"preset": cython}
+        if not isinstance(cython, dict):
+            raise ValidationError("build.cython must be a preset name or a table")
+
+        validate_dict_keys(
+            cython, required=None, optional=("preset",) + BabelConfig.CYTHON_DIRECTIVES
+        )
+        if cython.get("preset", "default") not in BabelConfig.CYTHON_PRESETS:
+            raise ValidationError(
+                f"build.cython: unknown preset ({cython['preset']}), must be one of"
+                f" {', '.join(sorted(BabelConfig.CYTHON_PRESETS))}"
+            )
+        for directive in BabelConfig.CYTHON_DIRECTIVES:
+            if not isinstance(cython.get(directive, False), bool):
+                raise ValidationError(
+                    f"build.cython: {directive} must be either true or false"
+                )
+
     @staticmethod
     def _handle_old_style_entry_points(library: dict[str, Any]) -> dict[str, Any]:
         def _header_ext(language: str) -> str:
@@ -265,7 +394,7 @@ class BabelConfig(Mapping[str, Any]):
         dict
             A dict of babelizer configuration.
         """
-        build: dict[str, list[str]] = defaultdict(list)
+        build: dict[str, Any] = defaultdict(list)
         with suppress(KeyError):
             build.update(config["build"])
 
@@ -285,17 +414,22 @@ class BabelConfig(Mapping[str, Any]):
         languages = [lib["language"] for lib in config["library"].values()]
         language = languages[0]
 
+        build_options = {
+            "undef_macros": build["undef_macros"],
+            "define_macros": build["define_macros"],
+            "libraries": build["libraries"],
+            "library_dirs": build["library_dirs"],
+            "include_dirs": build["include_dirs"],
+            "extra_compile_args": build["extra_compile_args"],
+        }
+        for key in ("profile", "cython", "single_extension"):
+            if key in build:
+                build_options[key] = build[key]
+
         return {
             "library": libraries,
             "components": config["library"],
-            "build": {
-                "undef_macros": build["undef_macros"],
-                "define_macros": build["define_macros"],
-                "libraries": build["libraries"],
-                "library_dirs": build["library_dirs"],
-                "include_dirs": build["include_dirs"],
-                "extra_compile_args": build["extra_compile_args"],
-            },
+            "build": build_options,
             "package": {
                 "name": config["package"]["name"],
                 "requirements": sorted(config["package"]["requirements"]),
@@ -308,6 +442,52 @@ class BabelConfig(Mapping[str, Any]):
             "language": language,
         }
 
+    def build_profile(self) -> dict[str, Any]:
+        """Get the compiler settings of the build profile.
+
+        Settings given in the profile table override those of the
+        named profile.
+
+        Returns
+        -------
+        dict
+            The profile's *name*, meson *buildtype*, and whether to build
+            with *ndebug* defined, with link-time optimization (*lto*) and
+            tuned for the *native* CPU. If no profile was given, an empty
+            dict.
+        """
+        profile = self._meta["build"].get("profile")
+        if profile is None:
+            return {}
+        if isinstance(profile, str):
+            profile = {"name": profile}
+
+        return (
+            {"name": profile["name"], "native": False}
+            | BabelConfig.BUILD_PROFILES[profile["name"]]
+            | dict(profile)
+        )
+
+    def cython_directives(self) -> dict[str, bool]:
+        """Get the Cython compiler directives for the generated wrappers.
+
+        Directives given in the cython table override those of the preset.
+
+        Returns
+        -------
+        dict
+            Values of the directives that differ from Cython's defaults, or
+            that were given explicitly.
+        """
+        cython = self._meta["build"].get("cython", {})
+        if isinstance(cython, str):
+            cython = {"preset": cython}
+
+        directives = dict(cython)
+        preset = directives.pop("preset", "default")
+
+        return BabelConfig.CYTHON_PRESETS[preset] | directives
+
     def dump(self, fp: io.TextIOBase, fmt: str = "toml") -> None:
         """Write serialized configuration to a file.
 
@@ -343,4 +523,7 @@ class BabelConfig(Mapping[str, Any]):
         str
             Serialized configuration as a TOML-formatted string
         """
-        return tomli_w.dumps(self._meta, multiline_strings=True)
+        import tomli_w
+
+        meta = {k: v for k, v in self._meta.items() if k not in self.DERIVED_KEYS}
+        return tomli_w.dumps(meta, multiline_strings=True)
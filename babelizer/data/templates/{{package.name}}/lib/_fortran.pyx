@@ -1,9 +1,51 @@
-# cython: language_level=3
+# cython: language_level=3{% for directive, value in cython_directives|dictsort %}, {{ directive }}={{ value }}{% endfor %}
+
+# start: _shared.pxd
+
+# Declarations shared by the extensions of a package (see _shared.pyx).
+
+cimport numpy as np
+
+cdef enum ValueKind:
+    KIND_DOUBLE
+    KIND_INT
+    KIND_FLOAT
+
+cdef class VarInfo:
+    cdef readonly object name
+    cdef readonly bytes c_name
+    cdef readonly object type
+    cdef readonly object dtype
+    cdef readonly int itemsize
+    cdef readonly int grid
+    cdef readonly int size
+    cdef readonly int nbytes
+    cdef readonly object location
+    cdef np.ndarray _buffer
+
+    cdef int check_size(self) except -1
+    cdef np.ndarray empty(self, shape)
+    cdef np.ndarray buffer(self)
+
+
+cdef Py_ssize_t count_steps(double start, double stop, double time_step) except -1
+cdef np.ndarray as_indices(VarInfo info, inds)
+cdef np.ndarray as_value_array(VarInfo info, buff, Py_ssize_t size=*)
+cdef bint is_direct_buffer(VarInfo info, np.ndarray array, Py_ssize_t size=*) except -1
+cdef tuple output_arrays(VarInfo info, out)
+cdef np.ndarray fill_output(np.ndarray array, np.ndarray dest, bint copy)
+cdef np.ndarray input_array(VarInfo info, buff)
+
+cpdef to_bytes(object string)
+cpdef to_string(object bytes)
+
+
+# start: _shared.pyx
+
 import ctypes
 
 cimport numpy as np
-from libc.stdlib cimport free
-from libc.stdlib cimport malloc
+from libc.math cimport ceil
 
 import numpy as np
 
@@ -27,7 +69,257 @@ for k in list(DTYPE_F_TO_PY.keys()):
 
 ENOMSG = 42  # No message of desired type
 
-cdef extern from "bmi_interoperability.h":
+
+def ok_or_raise(status):
+    if status != 0:
+        raise RuntimeError('error code {status}'.format(status=status))
+
+
+cdef Py_ssize_t count_steps(double start, double stop, double time_step) except -1:
+    """Get the number of time steps needed to advance from start to stop."""
+    if stop <= start:
+        return 0
+    if not time_step > 0.0:
+        raise ValueError(
+            'time step must be positive to run until a time ({time_step})'.format(
+                time_step=time_step
+            )
+        )
+    return <Py_ssize_t>ceil((stop - start) / time_step * (1.0 - 1e-12))
+
+
+cdef np.ndarray as_indices(VarInfo info, inds):
+    """Get indices into a variable as a contiguous array of C ints.
+
+    Indices must be integers in the range of the variable's values.
+    """
+    cdef np.ndarray array = np.asarray(inds).reshape(-1)
+
+    if array.size == 0:
+        return np.empty(0, dtype=np.intc)
+    if array.dtype.kind not in 'iu':
+        raise TypeError(
+            '{name}: indices must be integers, not {dtype}'.format(
+                name=info.name, dtype=array.dtype
+            )
+        )
+    if array.min() < 0 or array.max() >= info.size:
+        raise IndexError(
+            '{name}: index out of range for {size} values'.format(
+                name=info.name, size=info.size
+            )
+        )
+    return np.ascontiguousarray(array, dtype=np.intc)
+
+
+def check_buffer_size(name, np.ndarray buff, Py_ssize_t nbytes):
+    if not buff.flags.c_contiguous:
+        raise ValueError('{name}: buffer is not contiguous'.format(name=name))
+    if buff.nbytes < nbytes:
+        raise ValueError(
+            '{name}: buffer is too small ({actual} < {expected} bytes)'.format(
+                name=name, actual=buff.nbytes, expected=nbytes
+            )
+        )
+
+
+cdef class VarInfo:
+    """Metadata for a variable, as cached by a babelized class."""
+
+    def __init__(self, name, type, int itemsize, int grid, int nbytes, location):
+        self.name = name
+        self.c_name = name.encode('utf-8')
+        self.type = type
+        self.dtype = np.dtype(type)
+        self.itemsize = itemsize
+        self.grid = grid
+        self.nbytes = nbytes
+        self.size = nbytes // itemsize if itemsize > 0 else 0
+        self.location = location
+
+    cdef int check_size(self) except -1:
+        """Check that the model's item size and number of bytes fit the type.
+
+        Buffers are allocated for the variable's type but the model writes
+        *nbytes* bytes (or *itemsize* bytes per value) into them, so they
+        must agree.
+        """
+        if self.dtype.itemsize != self.itemsize or self.nbytes % self.itemsize != 0:
+            raise RuntimeError(
+                '{name}: size mismatch (type={type}, itemsize={itemsize}, '
+                'nbytes={nbytes})'.format(
+                    name=self.name,
+                    type=self.dtype,
+                    itemsize=self.itemsize,
+                    nbytes=self.nbytes,
+                )
+            )
+        return 0
+
+    cdef np.ndarray empty(self, shape):
+        """Get a new array of the variable's type for the model to fill."""
+        self.check_size()
+        return np.empty(shape, dtype=self.dtype)
+
+    cdef np.ndarray buffer(self):
+        """Get an array, reused between calls, to hold the variable's values."""
+        if self._buffer is None:
+            self._buffer = self.empty(self.size)
+        return self._buffer
+
+    def __repr__(self):
+        return (
+            'VarInfo(name={name!r}, type={type!r}, itemsize={itemsize}, '
+            'grid={grid}, nbytes={nbytes}, location={location!r})'
+        ).format(
+            name=self.name,
+            type=self.type,
+            itemsize=self.itemsize,
+            grid=self.grid,
+            nbytes=self.nbytes,
+            location=self.location,
+        )
+
+
+cpdef to_bytes(string):
+    try:
+        return bytes(string.encode('utf-8'))
+    except AttributeError:
+        return string
+
+
+cpdef to_string(bytes):
+    try:
+        return bytes.decode('utf-8').rstrip()
+    except AttributeError:
+        return bytes
+
+
+cdef np.ndarray as_value_array(VarInfo info, buff, Py_ssize_t size=-1):
+    """View a buffer as an array of a variable's values, without copying.
+
+    Untyped byte buffers (bytearray, mmap, shared memory, ...) are
+    reinterpreted as the variable's type. *size* is the number of values
+    the buffer is for, if not all of the variable's values.
+    """
+    cdef np.ndarray array
+    cdef Py_ssize_t nbytes = info.nbytes if size < 0 else size * info.dtype.itemsize
+    if isinstance(buff, np.ndarray):
+        array = buff
+    else:
+        array = np.asarray(memoryview(buff))
+
+    if (
+        array.dtype == np.uint8
+        and array.dtype != info.dtype
+        and array.flags.c_contiguous
+        and array.nbytes >= nbytes
+    ):
+        array = array.reshape(-1)[:nbytes].view(info.dtype)
+    return array
+
+
+cdef bint is_direct_buffer(VarInfo info, np.ndarray array, Py_ssize_t size=-1) except -1:
+    """Check if an array can be passed to the model as-is.
+
+    Arrays of the wrong type or layout must be copied, so they have to hold
+    exactly the number of values, *size* or the variable's size.
+    """
+    cdef Py_ssize_t nbytes = info.nbytes
+    if size < 0:
+        size = info.size
+    else:
+        nbytes = size * info.dtype.itemsize
+
+    info.check_size()
+    if array.dtype != info.dtype or not array.flags.c_contiguous:
+        if array.size != size:
+            raise ValueError(
+                '{name}: buffer holds {actual} values, expected {expected}'.format(
+                    name=info.name, actual=array.size, expected=size
+                )
+            )
+        return False
+    check_buffer_size(info.name, array, nbytes)
+    return True
+
+
+cdef tuple output_arrays(VarInfo info, out):
+    """Get the array for the model to write a variable's values into.
+
+    Returns the array and, if *out* can't be written to directly, the
+    array to copy the values into afterwards (see fill_output).
+    """
+    cdef np.ndarray array
+
+    if out is None:
+        return info.buffer(), None
+    array = as_value_array(info, out)
+    if not array.flags.writeable:
+        raise ValueError('{name}: buffer is read-only'.format(name=info.name))
+    if not is_direct_buffer(info, array):
+        return info.buffer(), array
+    return array, None
+
+
+cdef np.ndarray fill_output(np.ndarray array, np.ndarray dest, bint copy):
+    """Get the values written by the model, as returned by get_value."""
+    if dest is not None:
+        np.copyto(dest, array.reshape(np.shape(dest)), casting='same_kind')
+        array = dest
+    return array.copy() if copy else array
+
+
+cdef np.ndarray input_array(VarInfo info, buff):
+    """Get an array of a variable's values for the model to read.
+
+    The buffer is used as-is if its type and layout match the variable,
+    and is copied otherwise.
+    """
+    cdef np.ndarray array = as_value_array(info, buff)
+
+    if not is_direct_buffer(info, array):
+        array = array.astype(info.dtype, order='C', casting='same_kind', copy=False)
+    return array
+
+{%- for babelized_class, component in components|dictsort %}
+{%- set nogil = component.get("nogil", false) %}
+
+# start: {{ babelized_class|lower }}.pyx
+
+from sys import intern
+
+cimport numpy as np
+from libc.stdlib cimport free
+from libc.stdlib cimport malloc
+from libc.string cimport memset
+
+import numpy as np
+
+from ._shared cimport KIND_DOUBLE
+from ._shared cimport KIND_FLOAT
+from ._shared cimport KIND_INT
+from ._shared cimport ValueKind
+from ._shared cimport VarInfo
+from ._shared cimport as_indices
+from ._shared cimport as_value_array
+from ._shared cimport count_steps
+from ._shared cimport fill_output
+from ._shared cimport input_array
+from ._shared cimport is_direct_buffer
+from ._shared cimport output_arrays
+from ._shared cimport to_bytes
+from ._shared cimport to_string
+
+from ._shared import DTYPE_DOUBLE
+from ._shared import DTYPE_F_TO_PY
+from ._shared import DTYPE_FLOAT
+from ._shared import DTYPE_INT
+from ._shared import ENOMSG
+from ._shared import ok_or_raise
+
+
+cdef extern from "bmi_interoperability.h" nogil:
     int MAX_COMPONENT_NAME
     int MAX_VAR_NAME
     int MAX_TYPE_NAME
@@ -104,37 +396,42 @@ cdef extern from "bmi_interoperability.h":
     int bmi_set_value_double(int model, const char *var_name, int n_chars,
                              void *buffer, int size)
 
-
-def ok_or_raise(status):
-    if status != 0:
-        raise RuntimeError('error code {status}'.format(status=status))
-
-
-cpdef to_bytes(string):
-    try:
-        return bytes(string.encode('utf-8'))
-    except AttributeError:
-        return string
-
-
-cpdef to_string(bytes):
-    try:
-        return bytes.decode('utf-8').rstrip()
-    except AttributeError:
-        return bytes
-
-{%- for babelized_class in components %}
-
-# start: {{ babelized_class|lower }}.pyx
+    int bmi_get_value_at_indices_int(int model, const char *var_name,
+                                     int n_chars, void *buffer,
+                                     int *inds, int count)
+    int bmi_get_value_at_indices_float(int model, const char *var_name,
+                                       int n_chars, void *buffer,
+                                       int *inds, int count)
+    int bmi_get_value_at_indices_double(int model, const char *var_name,
+                                        int n_chars, void *buffer,
+                                        int *inds, int count)
+
+    int bmi_set_value_at_indices_int(int model, const char *var_name,
+                                     int n_chars, int *inds, int count,
+                                     void *buffer)
+    int bmi_set_value_at_indices_float(int model, const char *var_name,
+                                       int n_chars, int *inds, int count,
+                                       void *buffer)
+    int bmi_set_value_at_indices_double(int model, const char *var_name,
+                                        int n_chars, int *inds, int count,
+                                        void *buffer)
 
 cdef class {{ babelized_class }}:
 
     cdef int _bmi
     cdef char[2048] STR_BUFFER
+    cdef dict _var_info
+    cdef tuple _input_var_names
+    cdef tuple _output_var_names
+    cdef dict _input_var_index
+    cdef dict _output_var_index
 
     METADATA = "../data/{{ babelized_class }}"
 
     def __cinit__(self):
+        self._var_info = {}
+        # The model pool is shared by all instances so it is only changed
+        # (by bmi_new and bmi_finalize) while holding the GIL.
         self._bmi = bmi_new()
 
         if self._bmi < 0:
@@ -145,16 +442,24 @@ cdef class {{ babelized_class }}:
         return self._bmi
 
     cdef void reset_str_buffer(self):
-        self.STR_BUFFER = np.zeros(MAX_VAR_NAME, dtype=np.byte)
+        memset(self.STR_BUFFER, 0, MAX_VAR_NAME)
 
     def initialize(self, config_file):
-        status = <int>bmi_initialize(self._bmi, to_bytes(config_file),
-                                     len(config_file))
+        cdef bytes c_config_file = to_bytes(config_file)
+        cdef const char* c_path = c_config_file
+        cdef int n_chars = len(config_file)
+        cdef int status
+        with nogil({{ nogil }}):
+            status = bmi_initialize(self._bmi, c_path, n_chars)
         ok_or_raise(status)
+        self._var_info.clear()
+        self._clear_var_names()
 
     def finalize(self):
         status = <int>bmi_finalize(self._bmi)
         self._bmi = -1
+        self._var_info.clear()
+        self._clear_var_names()
         ok_or_raise(status)
 
     cpdef object get_component_name(self):
@@ -169,7 +474,7 @@ cdef class {{ babelized_class }}:
         ok_or_raise(<int>bmi_get_input_item_count(self._bmi, &count))
         return count
 
-    cpdef object get_input_var_names(self):
+    cdef tuple _fetch_input_var_names(self):
         cdef list py_names = []
         cdef char** names
         cdef int i
@@ -177,17 +482,16 @@ cdef class {{ babelized_class }}:
         cdef int status = 1
 
         ok_or_raise(<int>bmi_get_input_item_count(self._bmi, &count))
+        if count == 0:
+            return ()
 
         try:
             names = <char**>malloc(count * sizeof(char*))
-            names[0] = <char*>malloc(count * MAX_VAR_NAME * sizeof(char))
-            for i in range(1, count):
-                names[i] = names[i - 1] + MAX_VAR_NAME
 
             ok_or_raise(<int>bmi_get_input_var_names(self._bmi, names, count))
 
             for i in range(count):
-                py_names.append(to_string(names[i]))
+                py_names.append(intern(to_string(names[i])))
 
         except Exception:
             raise
@@ -202,7 +506,7 @@ cdef class {{ babelized_class }}:
         ok_or_raise(<int>bmi_get_output_item_count(self._bmi, &count))
         return count
 
-    cpdef object get_output_var_names(self):
+    cdef tuple _fetch_output_var_names(self):
         cdef list py_names = []
         cdef char** names
         cdef int i
@@ -210,17 +514,16 @@ cdef class {{ babelized_class }}:
         cdef int status = 1
 
         ok_or_raise(<int>bmi_get_output_item_count(self._bmi, &count))
+        if count == 0:
+            return ()
 
         try:
             names = <char**>malloc(count * sizeof(char*))
-            names[0] = <char*>malloc(count * MAX_VAR_NAME * sizeof(char))
-            for i in range(1, count):
-                names[i] = names[i - 1] + MAX_VAR_NAME
 
             ok_or_raise(<int>bmi_get_output_var_names(self._bmi, names, count))
 
             for i in range(count):
-                py_names.append(to_string(names[i]))
+                py_names.append(intern(to_string(names[i])))
 
         except Exception:
             raise
@@ -230,6 +533,44 @@ cdef class {{ babelized_class }}:
 
         return tuple(py_names)
 
+    cpdef object get_input_var_names(self):
+        if self._input_var_names is None:
+            self._cache_var_names()
+        return self._input_var_names
+
+    cpdef object get_output_var_names(self):
+        if self._output_var_names is None:
+            self._cache_var_names()
+        return self._output_var_names
+
+    def get_input_var_index(self, name):
+        """Get the position of an input variable in get_input_var_names()."""
+        if self._input_var_index is None:
+            self._cache_var_names()
+        return self._input_var_index[name]
+
+    def get_output_var_index(self, name):
+        """Get the position of an output variable in get_output_var_names()."""
+        if self._output_var_index is None:
+            self._cache_var_names()
+        return self._output_var_index[name]
+
+    cdef _cache_var_names(self):
+        self._input_var_names = self._fetch_input_var_names()
+        self._output_var_names = self._fetch_output_var_names()
+        self._input_var_index = {
+            name: i for i, name in enumerate(self._input_var_names)
+        }
+        self._output_var_index = {
+            name: i for i, name in enumerate(self._output_var_names)
+        }
+
+    cdef _clear_var_names(self):
+        self._input_var_names = None
+        self._output_var_names = None
+        self._input_var_index = None
+        self._output_var_index = None
+
     cpdef double get_start_time(self):
         cdef double time
         ok_or_raise(<int>bmi_get_start_time(self._bmi, &time))
@@ -257,11 +598,15 @@ cdef class {{ babelized_class }}:
         return to_string(self.STR_BUFFER)
 
     cpdef update(self):
-        status = <int>bmi_update(self._bmi)
+        cdef int status
+        with nogil({{ nogil }}):
+            status = bmi_update(self._bmi)
         ok_or_raise(status)
 
-    cpdef update_until(self, time_later):
-        status = <int>bmi_update_until(self._bmi, time_later)
+    cpdef update_until(self, double time_later):
+        cdef int status
+        with nogil({{ nogil }}):
+            status = bmi_update_until(self._bmi, time_later)
         ok_or_raise(status)
 
     cpdef int get_var_grid(self, var_name):
@@ -411,6 +756,34 @@ cdef class {{ babelized_class }}:
                                                          &nodes_per_face[0], size))
         return nodes_per_face
 
+    cpdef VarInfo get_var_info(self, name):
+        """Get a variable's metadata, fetching it from the model if needed."""
+        cdef VarInfo info = self._var_info.get(name)
+
+        if info is None:
+            info = VarInfo(
+                name,
+                self.get_var_type(name),
+                self.get_var_itemsize(name),
+                self.get_var_grid(name),
+                self.get_var_nbytes(name),
+                self.get_var_location(name),
+            )
+            self._var_info[name] = info
+
+        return info
+
+    def invalidate_var_info(self, name=None):
+        """Drop cached variable metadata.
+
+        Call this if a variable's grid, size or type changes while the
+        model is running; the metadata is fetched again on next use.
+        """
+        if name is None:
+            self._var_info.clear()
+        else:
+            self._var_info.pop(name, None)
+
     cpdef object get_var_type(self, var_name):
         self.reset_str_buffer()
         ok_or_raise(<int>bmi_get_var_type(self._bmi,
@@ -452,78 +825,485 @@ cdef class {{ babelized_class }}:
                                               MAX_TYPE_NAME))
         return to_string(self.STR_BUFFER)
 
-    cpdef np.ndarray get_value(self, var_name, np.ndarray buffer):
-        cdef int grid_id = self.get_var_grid(var_name)
-        cdef int grid_size = self.get_grid_size(grid_id)
-        type = self.get_var_type(var_name)
+    cpdef np.ndarray get_value(self, var_name, out=None, bint copy=False):
+        """Get a copy of a variable's values.
+
+        The values are written into *out* if given and otherwise into a
+        buffer that is kept for the variable and reused on every call. Pass
+        *copy=True* to get an array that later calls will not overwrite.
+
+        *out* can be any writable object that supports the buffer protocol.
+        It is filled in place, through a temporary copy if its type or
+        layout doesn't match the variable.
+        """
+        cdef VarInfo info = self.get_var_info(var_name)
+        cdef const char* c_name = info.c_name
+        cdef int n_chars = len(info.c_name)
+        cdef int size = info.size
+        cdef np.ndarray buff
+        cdef np.ndarray dest
+        cdef void* data
+        cdef int status = ENOMSG
+        type = info.type
+
+        buff, dest = output_arrays(info, out)
+        data = buff.data
 
         if type == DTYPE_DOUBLE:
-            ok_or_raise(<int>bmi_get_value_double(self._bmi,
-                                                  to_bytes(var_name),
-                                                  len(var_name),
-                                                  buffer.data,
-                                                  grid_size))
+            with nogil({{ nogil }}):
+                status = bmi_get_value_double(self._bmi,
+                                              c_name,
+                                              n_chars,
+                                              data,
+                                              size)
         elif type == DTYPE_INT:
-            ok_or_raise(<int>bmi_get_value_int(self._bmi,
-                                               to_bytes(var_name),
-                                               len(var_name),
-                                               buffer.data,
-                                               grid_size))
+            with nogil({{ nogil }}):
+                status = bmi_get_value_int(self._bmi,
+                                           c_name,
+                                           n_chars,
+                                           data,
+                                           size)
         elif type == DTYPE_FLOAT:
-            ok_or_raise(<int>bmi_get_value_float(self._bmi,
-                                                 to_bytes(var_name),
-                                                 len(var_name),
-                                                 buffer.data,
-                                                 grid_size))
-        else:
-            ok_or_raise(ENOMSG)
+            with nogil({{ nogil }}):
+                status = bmi_get_value_float(self._bmi,
+                                             c_name,
+                                             n_chars,
+                                             data,
+                                             size)
 
-        return buffer
+        ok_or_raise(status)
+
+        return fill_output(buff, dest, copy)
 
     cpdef np.ndarray get_value_ptr(self, var_name):
-        cdef int grid_id = self.get_var_grid(var_name)
-        cdef int grid_size = self.get_grid_size(grid_id)
+        cdef VarInfo info = self.get_var_info(var_name)
+        cdef int size = info.size
         cdef void* ptr
-        type = self.get_var_type(var_name)
+        type = info.type
 
+        info.check_size()
         ok_or_raise(<int>bmi_get_value_ptr(self._bmi,
-                                           to_bytes(var_name),
-                                           len(var_name), &ptr))
+                                           info.c_name,
+                                           len(info.c_name), &ptr))
 
         if type == DTYPE_DOUBLE:
-            return np.asarray(<np.float64_t[:grid_size]>ptr)
+            return np.asarray(<np.float64_t[:size]>ptr)
         elif type == DTYPE_INT:
-            return np.asarray(<np.int32_t[:grid_size]>ptr)
+            return np.asarray(<np.int32_t[:size]>ptr)
         elif type == DTYPE_FLOAT:
-            return np.asarray(<np.float32_t[:grid_size]>ptr)
+            return np.asarray(<np.float32_t[:size]>ptr)
         else:
             return ok_or_raise(ENOMSG)
 
-    cpdef set_value(self, var_name, np.ndarray buffer):
-        cdef int grid_id = self.get_var_grid(var_name)
-        cdef int grid_size = self.get_grid_size(grid_id)
-        type = self.get_var_type(var_name)
+    cpdef set_value(self, var_name, buffer):
+        """Set a variable's values from any object supporting the buffer protocol.
+
+        The buffer is passed to the model as-is if its type and layout match
+        the variable, and is copied otherwise.
+        """
+        cdef VarInfo info = self.get_var_info(var_name)
+        cdef const char* c_name = info.c_name
+        cdef int n_chars = len(info.c_name)
+        cdef int size = info.size
+        cdef np.ndarray src = input_array(info, buffer)
+        cdef void* data
+        cdef int status = ENOMSG
+        type = info.type
+
+        data = src.data
 
         if type == DTYPE_DOUBLE:
-            ok_or_raise(<int>bmi_set_value_double(self._bmi,
-                                                  to_bytes(var_name),
-                                                  len(var_name),
-                                                  buffer.data,
-                                                  grid_size))
+            with nogil({{ nogil }}):
+                status = bmi_set_value_double(self._bmi,
+                                              c_name,
+                                              n_chars,
+                                              data,
+                                              size)
         elif type == DTYPE_INT:
-            ok_or_raise(<int>bmi_set_value_int(self._bmi,
-                                               to_bytes(var_name),
-                                               len(var_name),
-                                               buffer.data,
-                                               grid_size))
+            with nogil({{ nogil }}):
+                status = bmi_set_value_int(self._bmi,
+                                           c_name,
+                                           n_chars,
+                                           data,
+                                           size)
         elif type == DTYPE_FLOAT:
-            ok_or_raise(<int>bmi_set_value_float(self._bmi,
-                                                 to_bytes(var_name),
-                                                 len(var_name),
-                                                 buffer.data,
-                                                 grid_size))
+            with nogil({{ nogil }}):
+                status = bmi_set_value_float(self._bmi,
+                                             c_name,
+                                             n_chars,
+                                             data,
+                                             size)
+
+        ok_or_raise(status)
+
+        return buffer
+
+    def get_values(self, names, dict out=None, bint copy=False):
+        """Get the values of several variables with one call.
+
+        Returns a dict that maps each name to its values, as returned by
+        get_value. Arrays already in *out* are filled in place. The values
+        are fetched in one loop, without returning to Python.
+        """
+        cdef list infos = [self.get_var_info(name) for name in names]
+        cdef list arrays = []
+        cdef list dests = []
+        cdef VarInfo info
+
+        if out is None:
+            out = {}
+        for info in infos:
+            array, dest = output_arrays(info, out.get(info.name))
+            arrays.append(array)
+            dests.append(dest)
+
+        self._transfer_values(infos, arrays, False)
+
+        for info, array, dest in zip(infos, arrays, dests):
+            out[info.name] = fill_output(array, dest, copy)
+        return out
+
+    def set_values(self, values):
+        """Set the values of several variables, given as a mapping, with one call."""
+        cdef list infos = []
+        cdef list arrays = []
+        cdef VarInfo info
+
+        for name, buff in values.items():
+            info = self.get_var_info(name)
+            infos.append(info)
+            arrays.append(input_array(info, buff))
+
+        self._transfer_values(infos, arrays, True)
+
+    cdef int _transfer_values(self, list infos, list arrays, bint is_set) except -1:
+        """Get (or, if *is_set*, set) the values of several variables in one loop."""
+        cdef Py_ssize_t n_vars = len(infos)
+        cdef const char** c_names = <const char**>malloc((n_vars + 1) * sizeof(char*))
+        cdef void** data = <void**>malloc((n_vars + 1) * sizeof(void*))
+        cdef int* n_chars = <int*>malloc((n_vars + 1) * sizeof(int))
+        cdef int* sizes = <int*>malloc((n_vars + 1) * sizeof(int))
+        cdef ValueKind* kinds = <ValueKind*>malloc((n_vars + 1) * sizeof(ValueKind))
+        cdef Py_ssize_t i
+        cdef int status = 0
+        cdef VarInfo info
+        cdef np.ndarray array
+
+        try:
+            if (
+                c_names is NULL or data is NULL or n_chars is NULL
+                or sizes is NULL or kinds is NULL
+            ):
+                raise MemoryError()
+            for i in range(n_vars):
+                info = infos[i]
+                array = arrays[i]
+                c_names[i] = info.c_name
+                n_chars[i] = len(info.c_name)
+                data[i] = array.data
+                sizes[i] = info.size
+                if info.type == DTYPE_DOUBLE:
+                    kinds[i] = KIND_DOUBLE
+                elif info.type == DTYPE_INT:
+                    kinds[i] = KIND_INT
+                elif info.type == DTYPE_FLOAT:
+                    kinds[i] = KIND_FLOAT
+                else:
+                    ok_or_raise(ENOMSG)
+
+            with nogil({{ nogil }}):
+                i = 0
+                while status == 0 and i < n_vars:
+                    if kinds[i] == KIND_DOUBLE and is_set:
+                        status = bmi_set_value_double(
+                            self._bmi, c_names[i], n_chars[i], data[i], sizes[i]
+                        )
+                    elif kinds[i] == KIND_DOUBLE:
+                        status = bmi_get_value_double(
+                            self._bmi, c_names[i], n_chars[i], data[i], sizes[i]
+                        )
+                    elif kinds[i] == KIND_INT and is_set:
+                        status = bmi_set_value_int(
+                            self._bmi, c_names[i], n_chars[i], data[i], sizes[i]
+                        )
+                    elif kinds[i] == KIND_INT:
+                        status = bmi_get_value_int(
+                            self._bmi, c_names[i], n_chars[i], data[i], sizes[i]
+                        )
+                    elif is_set:
+                        status = bmi_set_value_float(
+                            self._bmi, c_names[i], n_chars[i], data[i], sizes[i]
+                        )
+                    else:
+                        status = bmi_get_value_float(
+                            self._bmi, c_names[i], n_chars[i], data[i], sizes[i]
+                        )
+                    i += 1
+        finally:
+            free(c_names)
+            free(data)
+            free(n_chars)
+            free(sizes)
+            free(kinds)
+
+        ok_or_raise(status)
+        return 0
+
+    def run(self, n_steps=None, until=None, record=()):
+        """Update the model repeatedly, recording variables after each step.
+
+        Give either *n_steps*, the number of times to call update, or
+        *until*, a time to advance the model to, in which case the last
+        step is an update_until. The loop runs without returning to Python.
+
+        Returns a dict that maps each name in *record* to an
+        (n_steps, size) array of the variable's values after each step.
+        """
+        cdef list infos = [self.get_var_info(name) for name in record]
+        n_steps, finish, stop = self._plan_run(n_steps, until)
+        return self._record_steps(infos, n_steps, finish, stop)
+
+    def run_chunks(self, chunk_size, n_steps=None, until=None, record=()):
+        """Like run, but yield the recorded values every *chunk_size* steps."""
+        cdef list infos = [self.get_var_info(name) for name in record]
+        cdef Py_ssize_t done = 0
+        cdef Py_ssize_t n
+
+        if chunk_size < 1:
+            raise ValueError(
+                'chunk size must be positive ({chunk_size})'.format(
+                    chunk_size=chunk_size
+                )
+            )
+        n_steps, finish, stop = self._plan_run(n_steps, until)
+
+        while done < n_steps:
+            n = min(chunk_size, n_steps - done)
+            done += n
+            yield self._record_steps(infos, n, finish and done == n_steps, stop)
+
+    cdef tuple _plan_run(self, n_steps, until):
+        if (n_steps is None) == (until is None):
+            raise ValueError('give exactly one of n_steps or until')
+        if until is not None:
+            n_steps = count_steps(
+                self.get_current_time(), until, self.get_time_step()
+            )
+            return n_steps, True, float(until)
+        if n_steps < 0:
+            raise ValueError(
+                'number of steps must not be negative ({n_steps})'.format(
+                    n_steps=n_steps
+                )
+            )
+        return n_steps, False, 0.0
+
+    cdef dict _record_steps(
+        self, list infos, Py_ssize_t n_steps, bint finish, double until
+    ):
+        cdef dict out = {}
+        cdef list arrays = []
+        cdef VarInfo info
+
+        for info in infos:
+            array = info.empty((n_steps, info.size))
+            arrays.append(array)
+            out[info.name] = array
+        if n_steps > 0:
+            self._run(infos, arrays, n_steps, finish, until)
+        return out
+
+    cdef int _run(
+        self, list infos, list arrays, Py_ssize_t n_steps, bint finish, double until
+    ) except -1:
+        """Update the model, copying values into arrays after each step."""
+        cdef Py_ssize_t n_vars = len(infos)
+        cdef const char** c_names = <const char**>malloc((n_vars + 1) * sizeof(char*))
+        cdef char** data = <char**>malloc((n_vars + 1) * sizeof(char*))
+        cdef Py_ssize_t* nbytes = <Py_ssize_t*>malloc((n_vars + 1) * sizeof(Py_ssize_t))
+        cdef int* n_chars = <int*>malloc((n_vars + 1) * sizeof(int))
+        cdef int* sizes = <int*>malloc((n_vars + 1) * sizeof(int))
+        cdef ValueKind* kinds = <ValueKind*>malloc((n_vars + 1) * sizeof(ValueKind))
+        cdef Py_ssize_t i, step
+        cdef int status = 0
+        cdef VarInfo info
+        cdef np.ndarray array
+
+        try:
+            if (
+                c_names is NULL or data is NULL or nbytes is NULL
+                or n_chars is NULL or sizes is NULL or kinds is NULL
+            ):
+                raise MemoryError()
+            for i in range(n_vars):
+                info = infos[i]
+                array = arrays[i]
+                c_names[i] = info.c_name
+                n_chars[i] = len(info.c_name)
+                data[i] = array.data
+                nbytes[i] = info.nbytes
+                sizes[i] = info.size
+                if info.type == DTYPE_DOUBLE:
+                    kinds[i] = KIND_DOUBLE
+                elif info.type == DTYPE_INT:
+                    kinds[i] = KIND_INT
+                elif info.type == DTYPE_FLOAT:
+                    kinds[i] = KIND_FLOAT
+                else:
+                    ok_or_raise(ENOMSG)
+
+            with nogil({{ nogil }}):
+                for step in range(n_steps):
+                    if finish and step == n_steps - 1:
+                        status = bmi_update_until(self._bmi, until)
+                    else:
+                        status = bmi_update(self._bmi)
+                    i = 0
+                    while status == 0 and i < n_vars:
+                        if kinds[i] == KIND_DOUBLE:
+                            status = bmi_get_value_double(
+                                self._bmi, c_names[i], n_chars[i],
+                                data[i] + step * nbytes[i], sizes[i],
+                            )
+                        elif kinds[i] == KIND_INT:
+                            status = bmi_get_value_int(
+                                self._bmi, c_names[i], n_chars[i],
+                                data[i] + step * nbytes[i], sizes[i],
+                            )
+                        else:
+                            status = bmi_get_value_float(
+                                self._bmi, c_names[i], n_chars[i],
+                                data[i] + step * nbytes[i], sizes[i],
+                            )
+                        i += 1
+                    if status != 0:
+                        break
+        finally:
+            free(c_names)
+            free(data)
+            free(nbytes)
+            free(n_chars)
+            free(sizes)
+            free(kinds)
+
+        ok_or_raise(status)
+        return 0
+
+    cpdef np.ndarray get_value_at_indices(self, var_name, buffer=None, inds=None):
+        """Get a variable's values at some of its elements.
+
+        The values are written into *buffer* if given and otherwise into a new
+        array. As with get_value, *buffer* is filled through a temporary copy
+        if its type or layout doesn't match the variable.
+        """
+        cdef np.ndarray[int, ndim=1, mode='c'] c_inds
+        cdef int count
+        cdef VarInfo info = self.get_var_info(var_name)
+        cdef const char* c_name = info.c_name
+        cdef int n_chars = len(info.c_name)
+        cdef np.ndarray buff
+        cdef np.ndarray out = None
+        cdef void* data
+        cdef int status = ENOMSG
+        type = info.type
+
+        if inds is None:
+            raise TypeError('get_value_at_indices: missing indices')
+        c_inds = as_indices(info, inds)
+        count = c_inds.shape[0]
+        if buffer is None:
+            buff = info.empty(count)
         else:
-            ok_or_raise(ENOMSG)
+            buff = as_value_array(info, buffer, count)
+            if not buff.flags.writeable:
+                raise ValueError('{name}: buffer is read-only'.format(name=var_name))
+            if not is_direct_buffer(info, buff, count):
+                out, buff = buff, info.empty(count)
+        data = buff.data
+
+        if count == 0:
+            return buff if out is None else out
+
+        if type == DTYPE_DOUBLE:
+            with nogil({{ nogil }}):
+                status = bmi_get_value_at_indices_double(self._bmi,
+                                                         c_name,
+                                                         n_chars,
+                                                         data,
+                                                         &c_inds[0],
+                                                         count)
+        elif type == DTYPE_INT:
+            with nogil({{ nogil }}):
+                status = bmi_get_value_at_indices_int(self._bmi,
+                                                      c_name,
+                                                      n_chars,
+                                                      data,
+                                                      &c_inds[0],
+                                                      count)
+        elif type == DTYPE_FLOAT:
+            with nogil({{ nogil }}):
+                status = bmi_get_value_at_indices_float(self._bmi,
+                                                        c_name,
+                                                        n_chars,
+                                                        data,
+                                                        &c_inds[0],
+                                                        count)
+
+        ok_or_raise(status)
+
+        if out is not None:
+            np.copyto(out, buff.reshape(np.shape(out)), casting='same_kind')
+            buff = out
+        return buff
+
+    cpdef set_value_at_indices(self, var_name, inds, buffer):
+        """Set a variable's values at some of its elements.
+
+        The values in *buffer* are copied to the variable's type if needed.
+        """
+        cdef VarInfo info = self.get_var_info(var_name)
+        cdef np.ndarray[int, ndim=1, mode='c'] c_inds = as_indices(info, inds)
+        cdef int count = c_inds.shape[0]
+        cdef const char* c_name = info.c_name
+        cdef int n_chars = len(info.c_name)
+        cdef np.ndarray buff = as_value_array(info, buffer, count)
+        cdef void* data
+        cdef int status = ENOMSG
+        type = info.type
+
+        if not is_direct_buffer(info, buff, count):
+            buff = buff.astype(info.dtype, order='C', casting='same_kind', copy=False)
+        data = buff.data
+
+        if count == 0:
+            return buffer
+
+        if type == DTYPE_DOUBLE:
+            with nogil({{ nogil }}):
+                status = bmi_set_value_at_indices_double(self._bmi,
+                                                         c_name,
+                                                         n_chars,
+                                                         &c_inds[0],
+                                                         count,
+                                                         data)
+        elif type == DTYPE_INT:
+            with nogil({{ nogil }}):
+                status = bmi_set_value_at_indices_int(self._bmi,
+                                                      c_name,
+                                                      n_chars,
+                                                      &c_inds[0],
+                                                      count,
+                                                      data)
+        elif type == DTYPE_FLOAT:
+            with nogil({{ nogil }}):
+                status = bmi_set_value_at_indices_float(self._bmi,
+                                                        c_name,
+                                                        n_chars,
+                                                        &c_inds[0],
+                                                        count,
+                                                        data)
+
+        ok_or_raise(status)
 
         return buffer
 {% endfor -%}
@@ -17,27 +17,118 @@ module bmi_interoperability
 
   implicit none
 
-  integer, parameter :: N_MODELS = 2048
-  type ({{ component.entry_point }}) :: model_array(N_MODELS)
-  logical :: model_avail(N_MODELS) = .true.
+  ! Models are held through pointers so they keep their address (and any
+  ! pointers handed out by get_value_ptr stay valid) when the pool grows.
+  type :: model_slot
+     type ({{ component.entry_point }}), pointer :: ptr => null()
+  end type model_slot
+
+  ! The pool grows by adding chunks of slots, each twice the size of the
+  ! one before. Chunks are never moved or released, so a thread can use
+  ! its model without the GIL while another thread adds a chunk. The pool
+  ! itself (the chunks and the free list) is only changed by bmi_new and
+  ! bmi_finalize, which are called while holding the GIL.
+  type :: model_chunk
+     type (model_slot), pointer :: slots(:) => null()
+  end type model_chunk
+
+  integer, parameter :: INITIAL_POOL_SIZE = 16
+  integer, parameter :: MAX_CHUNKS = 24
+  type (model_chunk) :: model_chunks(MAX_CHUNKS)
+  integer :: n_chunks = 0
+  integer, allocatable :: free_slots(:)
+  integer :: n_free = 0
 
 contains
 
   !
-  ! Find the next unused model index in the array.
+  ! Add a chunk to the model pool, adding its slots to the free list.
+  !
+  subroutine grow_pool(stat)
+    integer, intent(out) :: stat
+    integer, allocatable :: new_free_slots(:)
+    integer :: i, n_old, n_new
+
+    stat = -1
+    if (n_chunks == MAX_CHUNKS) return
+
+    n_old = INITIAL_POOL_SIZE * (2**n_chunks - 1)
+    n_new = INITIAL_POOL_SIZE * 2**n_chunks
+
+    allocate(new_free_slots(n_old + n_new), stat=stat)
+    if (stat /= 0) return
+    allocate(model_chunks(n_chunks + 1)%slots(n_new), stat=stat)
+    if (stat /= 0) return
+
+    n_chunks = n_chunks + 1
+    call move_alloc(new_free_slots, free_slots)
+
+    ! Push the new slots so the lowest index is handed out first.
+    do i = n_old + n_new, n_old + 1, -1
+       n_free = n_free + 1
+       free_slots(n_free) = i
+    end do
+  end subroutine grow_pool
+
+  !
+  ! Find the slot of a model index, or return a null pointer if the index
+  ! is outside of the pool.
+  !
+  function find_slot(model_index) result(slot)
+    integer (c_int), intent(in) :: model_index
+    type (model_slot), pointer :: slot
+    integer :: j, k
+
+    slot => null()
+    if (model_index < 1) return
+
+    ! Chunk k holds indices 16 * (2**(k-1) - 1) + 1 through 16 * (2**k - 1).
+    j = (model_index - 1) / INITIAL_POOL_SIZE + 1
+    k = bit_size(j) - leadz(j)
+    if (k > MAX_CHUNKS) return
+    if (.not. associated(model_chunks(k)%slots)) return
+
+    slot => model_chunks(k)%slots( &
+         model_index - INITIAL_POOL_SIZE * (2**(k - 1) - 1))
+  end function find_slot
+
+  !
+  ! Find the model of an index in the pool. Returns false if the index does
+  ! not refer to a model that has not been finalized. Every function that
+  ! uses a model looks it up through here first.
+  !
+  function find_model(model_index, model_ptr) result(found)
+    integer (c_int), intent(in) :: model_index
+    type ({{ component.entry_point }}), pointer, intent(out) :: model_ptr
+    logical :: found
+    type (model_slot), pointer :: slot
+
+    model_ptr => null()
+    slot => find_slot(model_index)
+    if (associated(slot)) model_ptr => slot%ptr
+    found = associated(model_ptr)
+  end function find_model
+
+  !
+  ! Allocate a new model and return its index in the pool.
   !
   function bmi_new() bind(c) result(model_index)
     integer (c_int) :: model_index
-    integer :: i
+    type (model_slot), pointer :: slot
+    integer :: stat
 
     model_index = -1
-    do i = 1, N_MODELS
-       if (model_avail(i)) then
-          model_avail(i) = .false.
-          model_index = i
-          exit
-       end if
-    end do
+    if (n_free == 0) then
+       call grow_pool(stat)
+       if (stat /= 0) return
+    end if
+
+    slot => find_slot(free_slots(n_free))
+    allocate(slot%ptr, stat=stat)
+    if (stat /= 0) return
+
+    model_index = free_slots(n_free)
+    n_free = n_free - 1
   end function bmi_new
 
   !
@@ -50,13 +141,17 @@ contains
     character (len=1, kind=c_char), intent(in) :: config_file(n)
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: config_file_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     ! Convert `config_file` from rank-1 array to scalar.
     do i = 1, n
        config_file_(i:i) = config_file(i)
     enddo
 
-    status = model_array(model_index)%initialize(config_file_)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%initialize(config_file_)
   end function bmi_initialize
 
   !
@@ -65,9 +160,19 @@ contains
   function bmi_finalize(model_index) bind(c) result(status)
     integer (c_int), intent(in), value :: model_index
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+    type (model_slot), pointer :: slot
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%finalize()
 
-    status = model_array(model_index)%finalize()
-    model_avail(model_index) = .true.
+    ! Release the model and recycle its slot.
+    slot => find_slot(model_index)
+    deallocate(slot%ptr)
+    n_free = n_free + 1
+    free_slots(n_free) = model_index
   end function bmi_finalize
 
   !
@@ -82,8 +187,12 @@ contains
     integer (c_int) :: i, status
     character (len=n, kind=c_char), pointer :: pname
     character (len=n, kind=c_char) :: name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_component_name(pname)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_component_name(pname)
 
     ! Cast `pname` back to a string, dereferences `pname`.
     name_ = pname
@@ -104,8 +213,12 @@ contains
     integer (c_int), intent(out) :: count
     integer (c_int) :: status
     character (len=BMI_MAX_VAR_NAME), pointer :: pnames(:)
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_input_var_names(pnames)
+    status = model_ptr%get_input_var_names(pnames)
     count = size(pnames)
     status = BMI_SUCCESS
   end function bmi_get_input_item_count
@@ -120,8 +233,12 @@ contains
     type (c_ptr),  intent(out) :: names(n)
     integer (c_int) :: status, i
     character (len=BMI_MAX_VAR_NAME), dimension(:), pointer :: pnames
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_input_var_names(pnames)
+    status = model_ptr%get_input_var_names(pnames)
 
     do i = 1, n
        pnames(i) = trim(pnames(i))//C_NULL_CHAR
@@ -138,8 +255,12 @@ contains
     integer (c_int), intent(out) :: count
     integer (c_int) :: status
     character (len=BMI_MAX_VAR_NAME), pointer :: pnames(:)
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_output_var_names(pnames)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_output_var_names(pnames)
     count = size(pnames)
     status = BMI_SUCCESS
   end function bmi_get_output_item_count
@@ -154,8 +275,12 @@ contains
     type (c_ptr),  intent(out) :: names(n)
     integer (c_int) :: status, i
     character (len=BMI_MAX_VAR_NAME), dimension(:), pointer :: pnames
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_output_var_names(pnames)
+    status = model_ptr%get_output_var_names(pnames)
 
     do i = 1, n
        pnames(i) = trim(pnames(i))//C_NULL_CHAR
@@ -170,8 +295,12 @@ contains
     integer (c_int), intent(in), value :: model_index
     real (c_double), intent(out) :: time
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_start_time(time)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_start_time(time)
   end function bmi_get_start_time
 
   !
@@ -181,8 +310,12 @@ contains
     integer (c_int), intent(in), value :: model_index
     real (c_double), intent(out) :: time
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_end_time(time)
+    status = model_ptr%get_end_time(time)
   end function bmi_get_end_time
 
   !
@@ -192,8 +325,12 @@ contains
     integer (c_int), intent(in), value :: model_index
     real (c_double), intent(out) :: time
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_current_time(time)
+    status = model_ptr%get_current_time(time)
   end function bmi_get_current_time
 
   !
@@ -204,8 +341,12 @@ contains
     integer (c_int), intent(in), value :: model_index
     real (c_double), intent(out) :: time_step
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_time_step(time_step)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_time_step(time_step)
   end function bmi_get_time_step
 
   !
@@ -219,13 +360,17 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: time_units_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     ! Convert `time_units` from rank-1 array to scalar.
     do i = 1, n
        time_units_(i:i) = time_units(i)
     enddo
 
-    status = model_array(model_index)%get_time_units(time_units_)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_time_units(time_units_)
 
     ! Load the `time_units_` result back into `time_units` for output.
     do i = 1, len(trim(time_units_))
@@ -240,8 +385,12 @@ contains
   function bmi_update(model_index) bind(c) result(status)
     integer (c_int), intent(in), value :: model_index
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%update()
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%update()
   end function bmi_update
 
   !
@@ -251,8 +400,12 @@ contains
     integer (c_int), intent(in), value :: model_index
     real (c_double), intent(in), value :: time_later
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%update_until(time_later)
+    status = model_ptr%update_until(time_later)
   end function bmi_update_until
 
   !
@@ -266,13 +419,17 @@ contains
     integer (c_int), intent(out) :: grid_id
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     ! Convert `var_name` from rank-1 array to scalar.
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%get_var_grid(var_name_, grid_id)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_var_grid(var_name_, grid_id)
   end function bmi_get_var_grid
 
   !
@@ -287,12 +444,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: grid_type_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        grid_type_(i:i) = grid_type(i)
     enddo
 
-    status = model_array(model_index)%get_grid_type(grid_id, grid_type_)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_grid_type(grid_id, grid_type_)
 
     do i = 1, len(trim(grid_type_))
         grid_type(i) = grid_type_(i:i)
@@ -309,8 +470,12 @@ contains
     integer (c_int), intent(in), value :: grid_id
     integer (c_int), intent(out) :: grid_rank
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_rank(grid_id, grid_rank)
+    status = model_ptr%get_grid_rank(grid_id, grid_rank)
   end function bmi_get_grid_rank
 
   !
@@ -323,8 +488,12 @@ contains
     integer (c_int), intent(in), value :: n
     integer (c_int), intent(out) :: grid_shape(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_grid_shape(grid_id, grid_shape)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_grid_shape(grid_id, grid_shape)
   end function bmi_get_grid_shape
 
   !
@@ -336,8 +505,12 @@ contains
     integer (c_int), intent(in), value :: grid_id
     integer (c_int), intent(out) :: grid_size
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_size(grid_id, grid_size)
+    status = model_ptr%get_grid_size(grid_id, grid_size)
   end function bmi_get_grid_size
 
   !
@@ -350,8 +523,12 @@ contains
     integer (c_int), intent(in), value :: n
     real (c_double), intent(out) :: grid_spacing(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_spacing(grid_id, grid_spacing)
+    status = model_ptr%get_grid_spacing(grid_id, grid_spacing)
   end function bmi_get_grid_spacing
 
   !
@@ -364,8 +541,12 @@ contains
     integer (c_int), intent(in), value :: n
     real (c_double), intent(out) :: grid_origin(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_grid_origin(grid_id, grid_origin)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_grid_origin(grid_id, grid_origin)
   end function bmi_get_grid_origin
 
   !
@@ -378,8 +559,12 @@ contains
     integer (c_int), intent(in), value :: n
     real (c_double), intent(out) :: grid_x(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_x(grid_id, grid_x)
+    status = model_ptr%get_grid_x(grid_id, grid_x)
   end function bmi_get_grid_x
 
   !
@@ -392,8 +577,12 @@ contains
     integer (c_int), intent(in), value :: n
     real (c_double), intent(out) :: grid_y(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_y(grid_id, grid_y)
+    status = model_ptr%get_grid_y(grid_id, grid_y)
   end function bmi_get_grid_y
 
   !
@@ -406,8 +595,12 @@ contains
     integer (c_int), intent(in), value :: n
     real (c_double), intent(out) :: grid_z(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_grid_z(grid_id, grid_z)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_grid_z(grid_id, grid_z)
   end function bmi_get_grid_z
 
   !
@@ -419,8 +612,12 @@ contains
     integer (c_int), intent(in), value :: grid_id
     integer (c_int), intent(out) :: node_count
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_node_count(grid_id, node_count)
+    status = model_ptr%get_grid_node_count(grid_id, node_count)
   end function bmi_get_grid_node_count
 
   !
@@ -432,8 +629,12 @@ contains
     integer (c_int), intent(in), value :: grid_id
     integer (c_int), intent(out) :: edge_count
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_edge_count(grid_id, edge_count)
+    status = model_ptr%get_grid_edge_count(grid_id, edge_count)
   end function bmi_get_grid_edge_count
 
   !
@@ -445,8 +646,12 @@ contains
     integer (c_int), intent(in), value :: grid_id
     integer (c_int), intent(out) :: face_count
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_grid_face_count(grid_id, face_count)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_grid_face_count(grid_id, face_count)
   end function bmi_get_grid_face_count
 
   !
@@ -459,8 +664,12 @@ contains
     integer (c_int), intent(in), value :: n
     integer (c_int), intent(out) :: edge_nodes(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_edge_nodes(grid_id, edge_nodes)
+    status = model_ptr%get_grid_edge_nodes(grid_id, edge_nodes)
   end function bmi_get_grid_edge_nodes
 
   !
@@ -473,8 +682,12 @@ contains
     integer (c_int), intent(in), value :: n
     integer (c_int), intent(out) :: face_edges(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
-    status = model_array(model_index)%get_grid_face_edges(grid_id, face_edges)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_grid_face_edges(grid_id, face_edges)
   end function bmi_get_grid_face_edges
 
   !
@@ -487,8 +700,12 @@ contains
     integer (c_int), intent(in), value :: n
     integer (c_int), intent(out) :: face_nodes(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_face_nodes(grid_id, face_nodes)
+    status = model_ptr%get_grid_face_nodes(grid_id, face_nodes)
   end function bmi_get_grid_face_nodes
 
   !
@@ -501,8 +718,12 @@ contains
     integer (c_int), intent(in), value :: n
     integer (c_int), intent(out) :: nodes_per_face(n)
     integer (c_int) :: status
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
 
-    status = model_array(model_index)%get_grid_nodes_per_face(grid_id, nodes_per_face)
+    status = model_ptr%get_grid_nodes_per_face(grid_id, nodes_per_face)
   end function bmi_get_grid_nodes_per_face
 
   !
@@ -519,6 +740,7 @@ contains
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
     character (len=m, kind=c_char) :: var_type_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
@@ -527,7 +749,10 @@ contains
        var_type_(i:i) = var_type(i)
     enddo
 
-    status = model_array(model_index)%get_var_type(var_name_, var_type_)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_var_type(var_name_, var_type_)
 
     do i = 1, len(trim(var_type_))
         var_type(i) = var_type_(i:i)
@@ -549,6 +774,7 @@ contains
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
     character (len=m, kind=c_char) :: var_units_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
@@ -557,7 +783,10 @@ contains
        var_units_(i:i) = var_units(i)
     enddo
 
-    status = model_array(model_index)%get_var_units(var_name_, var_units_)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_var_units(var_name_, var_units_)
 
     do i = 1, len(trim(var_units_))
         var_units(i) = var_units_(i:i)
@@ -577,12 +806,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%get_var_itemsize(var_name_, var_itemsize)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_var_itemsize(var_name_, var_itemsize)
   end function bmi_get_var_itemsize
 
   !
@@ -597,12 +830,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%get_var_nbytes(var_name_, var_nbytes)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_var_nbytes(var_name_, var_nbytes)
   end function bmi_get_var_nbytes
 
   !
@@ -619,6 +856,7 @@ contains
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
     character (len=m, kind=c_char) :: var_location_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
@@ -627,7 +865,10 @@ contains
        var_location_(i:i) = var_location(i)
     enddo
 
-    status = model_array(model_index)%get_var_location(var_name_, var_location_)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_var_location(var_name_, var_location_)
 
     do i = 1, len(trim(var_location_))
         var_location(i) = var_location_(i:i)
@@ -648,12 +889,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%get_value(var_name_, buffer)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_value(var_name_, buffer)
   end function bmi_get_value_int
 
   !
@@ -669,12 +914,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%get_value(var_name_, buffer)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_value(var_name_, buffer)
     ! write(*,*) "Fortran"
     ! write(*,'(8f6.2)') buffer
     ! write(*,'(48f6.1)') buffer
@@ -696,12 +945,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%get_value(var_name_, buffer)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_value(var_name_, buffer)
   end function bmi_get_value_double
 
   !
@@ -720,26 +973,30 @@ contains
     integer, pointer :: idest(:)
     real, pointer :: rdest(:)
     double precision, pointer :: ddest(:)
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%get_var_type(var_name_, var_type)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%get_var_type(var_name_, var_type)
 
     select case(var_type)
     case("integer", "INTEGER")
-       status = model_array(model_index)%get_value_ptr(var_name_, idest)
+       status = model_ptr%get_value_ptr(var_name_, idest)
        if (status == BMI_SUCCESS) then
           ref = c_loc(idest(1))
        end if
     case("real", "REAL", "real*4", "REAL*4")
-       status = model_array(model_index)%get_value_ptr(var_name_, rdest)
+       status = model_ptr%get_value_ptr(var_name_, rdest)
        if (status == BMI_SUCCESS) then
           ref = c_loc(rdest(1))
        end if
     case("double precision", "DOUBLE PRECISION", "real*8", "REAL*8")
-       status = model_array(model_index)%get_value_ptr(var_name_, ddest)
+       status = model_ptr%get_value_ptr(var_name_, ddest)
        if (status == BMI_SUCCESS) then
           ref = c_loc(ddest(1))
        end if
@@ -761,12 +1018,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%set_value(var_name_, buffer)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%set_value(var_name_, buffer)
   end function bmi_set_value_int
 
   !
@@ -782,12 +1043,16 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%set_value(var_name_, buffer)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%set_value(var_name_, buffer)
 
     ! (1) Can't have assumed-shape array `buffer(:)` with bind(c).
     ! (2) Can't have type-bound (therefore generic) procedures with bind(c).
@@ -806,13 +1071,185 @@ contains
 
     integer (c_int) :: i, status
     character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
 
     do i = 1, n
        var_name_(i:i) = var_name(i)
     enddo
 
-    status = model_array(model_index)%set_value(var_name_, buffer)
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    status = model_ptr%set_value(var_name_, buffer)
   end function bmi_set_value_double
 
+  !
+  ! Get a copy of an integer variable's values at a set of (0-based) indices.
+  !
+  function bmi_get_value_at_indices_int(model_index, var_name, n, buffer, &
+       inds, m) bind(c) result(status)
+    integer (c_int), intent(in), value :: model_index
+    integer (c_int), intent(in), value :: n
+    character (len=1, kind=c_char), intent(in) :: var_name(n)
+    integer (c_int), intent(in), value :: m
+    integer (c_int), intent(inout) :: buffer(m)
+    integer (c_int), intent(in) :: inds(m)
+
+    integer (c_int) :: i, status
+    character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    do i = 1, n
+       var_name_(i:i) = var_name(i)
+    enddo
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    ! Fortran models use 1-based indices.
+    status = model_ptr%get_value_at_indices(var_name_, &
+         buffer, inds + 1)
+  end function bmi_get_value_at_indices_int
+
+  !
+  ! Get a copy of a float variable's values at a set of (0-based) indices.
+  !
+  function bmi_get_value_at_indices_float(model_index, var_name, n, buffer, &
+       inds, m) bind(c) result(status)
+    integer (c_int), intent(in), value :: model_index
+    integer (c_int), intent(in), value :: n
+    character (len=1, kind=c_char), intent(in) :: var_name(n)
+    integer (c_int), intent(in), value :: m
+    real (c_float), intent(inout) :: buffer(m)
+    integer (c_int), intent(in) :: inds(m)
+
+    integer (c_int) :: i, status
+    character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    do i = 1, n
+       var_name_(i:i) = var_name(i)
+    enddo
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    ! Fortran models use 1-based indices.
+    status = model_ptr%get_value_at_indices(var_name_, &
+         buffer, inds + 1)
+  end function bmi_get_value_at_indices_float
+
+  !
+  ! Get a copy of a double precision variable's values at a set of (0-based) indices.
+  !
+  function bmi_get_value_at_indices_double(model_index, var_name, n, buffer, &
+       inds, m) bind(c) result(status)
+    integer (c_int), intent(in), value :: model_index
+    integer (c_int), intent(in), value :: n
+    character (len=1, kind=c_char), intent(in) :: var_name(n)
+    integer (c_int), intent(in), value :: m
+    real (c_double), intent(inout) :: buffer(m)
+    integer (c_int), intent(in) :: inds(m)
+
+    integer (c_int) :: i, status
+    character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    do i = 1, n
+       var_name_(i:i) = var_name(i)
+    enddo
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    ! Fortran models use 1-based indices.
+    status = model_ptr%get_value_at_indices(var_name_, &
+         buffer, inds + 1)
+  end function bmi_get_value_at_indices_double
+
+  !
+  ! Set an integer variable's values at a set of (0-based) indices.
+  !
+  function bmi_set_value_at_indices_int(model_index, var_name, n, inds, m, &
+       buffer) bind(c) result(status)
+    integer (c_int), intent(in), value :: model_index
+    integer (c_int), intent(in), value :: n
+    character (len=1, kind=c_char), intent(in) :: var_name(n)
+    integer (c_int), intent(in), value :: m
+    integer (c_int), intent(in) :: inds(m)
+    integer (c_int), intent(in) :: buffer(m)
+
+    integer (c_int) :: i, status
+    character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    do i = 1, n
+       var_name_(i:i) = var_name(i)
+    enddo
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    ! Fortran models use 1-based indices.
+    status = model_ptr%set_value_at_indices(var_name_, &
+         inds + 1, buffer)
+  end function bmi_set_value_at_indices_int
+
+  !
+  ! Set a float variable's values at a set of (0-based) indices.
+  !
+  function bmi_set_value_at_indices_float(model_index, var_name, n, inds, m, &
+       buffer) bind(c) result(status)
+    integer (c_int), intent(in), value :: model_index
+    integer (c_int), intent(in), value :: n
+    character (len=1, kind=c_char), intent(in) :: var_name(n)
+    integer (c_int), intent(in), value :: m
+    integer (c_int), intent(in) :: inds(m)
+    real (c_float), intent(in) :: buffer(m)
+
+    integer (c_int) :: i, status
+    character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    do i = 1, n
+       var_name_(i:i) = var_name(i)
+    enddo
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    ! Fortran models use 1-based indices.
+    status = model_ptr%set_value_at_indices(var_name_, &
+         inds + 1, buffer)
+  end function bmi_set_value_at_indices_float
+
+  !
+  ! Set a double precision variable's values at a set of (0-based) indices.
+  !
+  function bmi_set_value_at_indices_double(model_index, var_name, n, inds, m, &
+       buffer) bind(c) result(status)
+    integer (c_int), intent(in), value :: model_index
+    integer (c_int), intent(in), value :: n
+    character (len=1, kind=c_char), intent(in) :: var_name(n)
+    integer (c_int), intent(in), value :: m
+    integer (c_int), intent(in) :: inds(m)
+    real (c_double), intent(in) :: buffer(m)
+
+    integer (c_int) :: i, status
+    character (len=n, kind=c_char) :: var_name_
+    type ({{ component.entry_point }}), pointer :: model_ptr
+
+    do i = 1, n
+       var_name_(i:i) = var_name(i)
+    enddo
+
+    status = BMI_FAILURE
+    if (.not. find_model(model_index, model_ptr)) return
+
+    ! Fortran models use 1-based indices.
+    status = model_ptr%set_value_at_indices(var_name_, &
+         inds + 1, buffer)
+  end function bmi_set_value_at_indices_double
+
 end module bmi_interoperability
 {%- endfor %}
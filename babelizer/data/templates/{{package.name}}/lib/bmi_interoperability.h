@@ -76,3 +76,17 @@ int bmi_set_value_float(int model, const char *var_name, int n_chars,
 			void *buffer, int size);
 int bmi_set_value_double(int model, const char *var_name, int n_chars,
 			 void *buffer, int size);
+
+int bmi_get_value_at_indices_int(int model, const char *var_name, int n_chars,
+				 void *buffer, int *inds, int count);
+int bmi_get_value_at_indices_float(int model, const char *var_name, int n_chars,
+				   void *buffer, int *inds, int count);
+int bmi_get_value_at_indices_double(int model, const char *var_name, int n_chars,
+				    void *buffer, int *inds, int count);
+
+int bmi_set_value_at_indices_int(int model, const char *var_name, int n_chars,
+				 int *inds, int count, void *buffer);
+int bmi_set_value_at_indices_float(int model, const char *var_name, int n_chars,
+				   int *inds, int count, void *buffer);
+int bmi_set_value_at_indices_double(int model, const char *var_name, int n_chars,
+				    int *inds, int count, void *buffer);
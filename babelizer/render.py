@@ -14,6 +14,7 @@ from babelizer._files.gitignore import render as render_gitignore
 from babelizer._files.init_py import render as render_init
 from babelizer._files.lib_init_py import render as render_lib_init
 from babelizer._files.license_rst import render as render_license
+from babelizer._manifest import sync_files
 from babelizer.config import BabelConfig
 from babelizer.errors import OutputDirExistsError
 
@@ -48,11 +49,79 @@ def render(
     str
         Path to babelized library
 
+    Notes
+    -----
+    The project is rendered in memory (see :func:`render_files`) and then
+    written to *output*. When clobbering an existing project, only files
+    whose contents differ from those on disk are written.
+
     Raises
     ------
     OutputDirExistsError
         Raised if output directory exists and clobber is not set.
     """
+    path, _, _ = _render(
+        babel_config,
+        output,
+        template=template,
+        clobber=clobber,
+        version=version,
+        make_pretty=make_pretty,
+    )
+    return path
+
+
+def _render(
+    babel_config: BabelConfig,
+    output: str,
+    template: str | None = None,
+    clobber: bool = False,
+    version: str = "0.1",
+    make_pretty: bool = False,
+) -> tuple[str, set[str], set[str]]:
+    """Generate a babelized library, returning the paths it produced.
+
+    Takes the same arguments as :func:`render`. Returns the path to the
+    babelized library along with the paths of the files, relative to that
+    folder, that were generated and of those that were written (because
+    they were new or their contents changed).
+    """
+    if os.path.exists(output) and not clobber:
+        raise OutputDirExistsError(output)
+
+    files, links = render_files(babel_config, template=template, version=version)
+    written = sync_files(files, output, links=links)
+
+    path = os.path.realpath(output)
+
+    git.Repo.init(path)
+
+    return path, set(files) | set(links), written
+
+
+def render_files(
+    babel_config: BabelConfig,
+    template: str | None = None,
+    version: str = "0.1",
+) -> tuple[dict[str, bytes], dict[str, str]]:
+    """Generate a babelized library in memory.
+
+    Parameters
+    ----------
+    babel_config : BabelConfig
+        The configuration used to babelize the library.
+    template : str, optional
+        Path to the cookiecutter template to use.
+    version : str, optional
+        Version of babelized library.
+
+    Returns
+    -------
+    tuple of dict
+        Contents of the generated files, and the targets of symbolic
+        links, keyed by path relative to the top of the project (with
+        forward slashes). The files include the project's *babel.toml*.
+    """
     if template is None:
         template = get_template_dir()
 
@@ -66,18 +135,13 @@ def render(
         },
         "now": datetime.datetime.now(),
         "package_version": version,
+        "build_profile": babel_config.build_profile(),
+        "cython_directives": babel_config.cython_directives(),
+        "single_extension": babel_config["build"].get("single_extension", False),
     } | {k: babel_config[k] for k in babel_config}
 
-    if os.path.exists(output):
-        raise OutputDirExistsError(output)
-
-    cookiecutter(template, context=context, output_dir=output)
+    files, links = cookiecutter(template, context=context)
 
-    path = os.path.realpath(output)
-
-    with open(os.path.join(path, "babel.toml"), "w") as fp:
-        babel_config.dump(fp, fmt="toml")
+    files["babel.toml"] = babel_config.format(fmt="toml").encode()
 
-    git.Repo.init(path)
-
-    return path
+    return files, links
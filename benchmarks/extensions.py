@@ -0,0 +1,172 @@
+"""Compare building components as one extension each or as a single extension.
+
+For each layout, a project is generated from the sample configurations in
+external/tests (with their library repeated to give several components),
+built into a wheel, and the time to import the package is measured in new
+interpreters. This needs meson-python, a compiler, and the example model
+libraries on the pkg-config path (see the build-examples nox session).
+Run from the top of the repository with, for example,
+
+    python benchmarks/extensions.py --components 1,10 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+import zipfile
+from typing import Any
+
+if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
+    import tomllib
+else:  # pragma: no cover (<PY311)
+    import tomli as tomllib
+
+import run
+import startup
+
+LANGUAGES = ("c", "c++")
+LAYOUTS = {"component": False, "single": True}
+
+
+def build_wheel(project: str, wheelhouse: str) -> tuple[float, str]:
+    """Build a project's wheel, returning the time taken and the wheel's path."""
+    start = time.perf_counter()
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "wheel",
+            "--quiet",
+            "--no-deps",
+            "--no-build-isolation",
+            "--wheel-dir",
+            wheelhouse,
+            project,
+        ],
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    (wheel,) = pathlib.Path(wheelhouse).glob("*.whl")
+    return elapsed, str(wheel)
+
+
+def time_import(package: str, path: str, repeat: int = 10) -> list[float]:
+    """Time importing a package in new interpreters."""
+    env = os.environ | {"PYTHONPATH": path}
+    command = [sys.executable, "-c", f"import {package}"]
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, env=env)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def benchmark(
+    workdir: str, language: str, components: int, single: bool, repeat: int = 10
+) -> dict[str, Any]:
+    from babelizer.config import BabelConfig
+    from babelizer.render import render
+
+    meta = tomllib.loads(run.make_config(language, components))
+    meta["build"]["single_extension"] = single
+    babel_config = BabelConfig(**meta)
+
+    package = babel_config["package"]["name"]
+    folder = os.path.join(workdir, f"{language}-{components}-{single}")
+    os.makedirs(folder)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        project = render(babel_config, os.path.join(folder, package))
+
+    build_time, wheel = build_wheel(project, os.path.join(folder, "dist"))
+
+    site = os.path.join(folder, "site")
+    with zipfile.ZipFile(wheel) as zf:
+        zf.extractall(site)
+        extensions = [name for name in zf.namelist() if name.endswith(".so")]
+
+    import_times = time_import(package, site, repeat=repeat)
+
+    return {
+        "build": build_time,
+        "wheel_size": os.path.getsize(wheel),
+        "extensions": len(extensions),
+        "import": statistics.median(import_times),
+        "import_times": import_times,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--language",
+        action="append",
+        choices=LANGUAGES,
+        help="Language to benchmark (may be repeated) [default: all]",
+    )
+    parser.add_argument(
+        "--components",
+        type=lambda s: [int(n) for n in s.split(",")],
+        default=[1, 10],
+        help="Comma-separated numbers of components [default: 1,10]",
+    )
+    parser.add_argument("--output", type=pathlib.Path, help="Write results here")
+    args = parser.parse_args(argv)
+
+    python = statistics.median(
+        startup.time_command([sys.executable, "-c", "pass"], repeat=args.repeat)
+    )
+    print(f"python startup {python:.3f}s")
+    print(
+        f"{'language':<10}{'components':>10}  {'layout':<10}"
+        f"{'build':>9}{'wheel':>11}{'import':>9}"
+    )
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for language in args.language or LANGUAGES:
+            for components in args.components:
+                for layout, single in LAYOUTS.items():
+                    result = benchmark(
+                        workdir, language, components, single, repeat=args.repeat
+                    )
+                    results.append(
+                        {
+                            "language": language,
+                            "components": components,
+                            "layout": layout,
+                        }
+                        | result
+                    )
+                    print(
+                        f"{language:<10}{components:>10}  {layout:<10}"
+                        f"{result['build']:8.1f}s"
+                        f"{result['wheel_size'] / 1024:8.0f}KiB"
+                        f"{result['import']:8.3f}s"
+                    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w") as fp:
+            json.dump({"python": python, "results": results}, fp, indent=2)
+            fp.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
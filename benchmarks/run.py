@@ -0,0 +1,267 @@
+"""Benchmark the babelizer's render and update paths.
+
+Run from the top of the repository with, for example,
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare results.json
+
+Projects are generated from the sample configurations in external/tests,
+with their library repeated to give 1, 10 and 100 components. Caches are
+kept in a new folder and warmed before timing. Results are stored as
+JSON; compare them with an earlier run to fail on regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import io
+import json
+import os
+import pathlib
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from collections.abc import Callable
+from collections.abc import Iterator
+from functools import partial
+from typing import Any
+
+import tomli_w
+
+if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
+    import tomllib
+else:  # pragma: no cover (<PY311)
+    import tomli as tomllib
+
+import startup
+
+ROOT = pathlib.Path(__file__).parent.parent
+LANGUAGES = {"c": "c", "c++": "cxx", "fortran": "fortran", "python": "python"}
+COMPONENTS = (1, 10, 100)
+
+Case = tuple[str, dict[str, Any], Callable[[], object], Callable[[], object] | None]
+
+
+def make_config(language: str, components: int) -> str:
+    """Make a configuration file with some number of components."""
+    path = ROOT / "external" / "tests" / f"test_{LANGUAGES[language]}" / "babel.toml"
+    with open(path, "rb") as fp:
+        meta = tomllib.load(fp)
+
+    ((name, library),) = meta["library"].items()
+    meta["library"] = {f"{name}{i}": dict(library) for i in range(components)}
+
+    return tomli_w.dumps(meta)
+
+
+def measure(
+    func: Callable[[], object],
+    setup: Callable[[], object] | None = None,
+    repeat: int = 5,
+) -> list[float]:
+    """Time a function, calling *setup* (untimed) before each call."""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def cases(workdir: str, languages: list[str], components: list[int]) -> Iterator[Case]:
+    from babelizer._datadir import get_template_dir
+    from babelizer._utils import as_cwd
+    from babelizer.cli import _init_package
+    from babelizer.cli import _update_package
+    from babelizer.config import BabelConfig
+    from babelizer.render import render_files
+
+    template = get_template_dir()
+
+    for language in languages:
+        for n_components in components:
+            params = {"language": language, "components": n_components}
+            text = make_config(language, n_components)
+
+            def load(text: str = text) -> BabelConfig:
+                return BabelConfig.from_stream(io.StringIO(text), fmt="toml")
+
+            babel_config = load()
+            yield "config.parse", params, load, None
+
+            yield "render.memory", params, partial(render_files, babel_config), None
+
+            output = os.path.join(workdir, babel_config["package"]["name"])
+
+            def remove(output: str = output) -> None:
+                shutil.rmtree(output, ignore_errors=True)
+
+            def init(c: BabelConfig = babel_config) -> None:
+                with as_cwd(workdir):
+                    _init_package(c, template, "0.1")
+
+            yield "init", params, init, remove
+
+            def update(output: str = output, c: BabelConfig = babel_config) -> None:
+                _update_package(output, c, template, "0.1")
+
+            yield "update.noop", params, update, None
+
+            def edit(output: str = output) -> None:
+                with open(os.path.join(output, "README.rst"), "a") as fp:
+                    fp.write("An edit that update will undo.\n")
+
+            yield "update.change", params, update, edit
+
+            remove()
+
+    for name, command in startup.COMMANDS.items():
+        yield "startup", {"command": name}, partial(startup.run, command), None
+
+
+def run_benchmarks(
+    languages: list[str],
+    components: list[int],
+    repeat: int = 5,
+    select: str | None = None,
+) -> list[dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, params, func, setup in cases(workdir, languages, components):
+            if select and select not in name:
+                continue
+
+            # Warm up caches, and create the project that an update needs.
+            if setup is not None:
+                setup()
+            func()
+
+            times = measure(func, setup=setup, repeat=repeat)
+            median = statistics.median(times)
+            results.append(
+                {
+                    "name": name,
+                    "params": params,
+                    "times": times,
+                    "min": min(times),
+                    "median": median,
+                }
+            )
+            print(f"{name:<16}{_format_params(params):<32}{median:8.3f}s")
+    return results
+
+
+def compare(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    tolerance: float = 0.25,
+    min_seconds: float = 0.01,
+) -> list[str]:
+    """Find benchmarks that are slower than a baseline.
+
+    A benchmark is a regression if its median time is more than *tolerance*
+    (as a fraction) and more than *min_seconds* slower than the baseline.
+    """
+    expected = {_key(result): result["median"] for result in baseline}
+
+    regressions = []
+    for result in results:
+        if (before := expected.get(_key(result))) is None:
+            continue
+        after = result["median"]
+        if after > before * (1.0 + tolerance) and after - before > min_seconds:
+            regressions.append(
+                f"{result['name']} {_format_params(result['params'])}:"
+                f" {before:.3f}s -> {after:.3f}s"
+            )
+    return regressions
+
+
+def _key(result: dict[str, Any]) -> str:
+    return json.dumps([result["name"], result["params"]], sort_keys=True)
+
+
+def _format_params(params: dict[str, Any]) -> str:
+    return " ".join(f"{k}={v}" for k, v in params.items())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--language",
+        action="append",
+        choices=sorted(LANGUAGES),
+        help="Language to benchmark (may be repeated) [default: all]",
+    )
+    parser.add_argument(
+        "--components",
+        type=lambda s: [int(n) for n in s.split(",")],
+        default=list(COMPONENTS),
+        help="Comma-separated numbers of components [default: 1,10,100]",
+    )
+    parser.add_argument("-k", dest="select", help="Only run matching benchmarks")
+    parser.add_argument("--output", type=pathlib.Path, help="Write results here")
+    parser.add_argument(
+        "--compare", type=pathlib.Path, help="Fail if slower than these results"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slow down, as a fraction, when comparing [default: 0.25]",
+    )
+    args = parser.parse_args(argv)
+
+    os.environ["BABELIZER_CACHE_DIR"] = tempfile.mkdtemp(prefix="babelizer-bench-")
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = run_benchmarks(
+                args.language or list(LANGUAGES),
+                args.components,
+                repeat=args.repeat,
+                select=args.select,
+            )
+    finally:
+        shutil.rmtree(os.environ["BABELIZER_CACHE_DIR"], ignore_errors=True)
+
+    if args.output:
+        from babelizer import __version__
+
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w") as fp:
+            json.dump(
+                {
+                    "babelizer": __version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "results": results,
+                },
+                fp,
+                indent=2,
+            )
+            fp.write("\n")
+
+    if args.compare:
+        with open(args.compare) as fp:
+            regressions = compare(
+                results, json.load(fp)["results"], tolerance=args.tolerance
+            )
+        for regression in regressions:
+            print(f"slower: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
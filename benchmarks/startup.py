@@ -0,0 +1,66 @@
+"""Time how long the babelize command takes to start.
+
+Each command is run in a new interpreter so that nothing is already
+imported. Run from the top of the repository with, for example,
+
+    python benchmarks/startup.py --repeat 20 --max-seconds 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "import": [sys.executable, "-c", "import babelizer.cli"],
+    "help": [sys.executable, "-m", "babelizer.cli", "--help"],
+    "sample-config": [sys.executable, "-m", "babelizer.cli", "sample-config"],
+}
+
+
+def run(command: list[str]) -> None:
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+def time_command(command: list[str], repeat: int = 10) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(command)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="Fail if the median time of any command is longer than this",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = statistics.median(
+        time_command([sys.executable, "-c", "pass"], repeat=args.repeat)
+    )
+    print(f"{'python':<16}{baseline:8.3f}s")
+
+    slow = []
+    for name, command in COMMANDS.items():
+        median = statistics.median(time_command(command, repeat=args.repeat))
+        print(f"{name:<16}{median:8.3f}s")
+        if args.max_seconds is not None and median > args.max_seconds:
+            slow.append(name)
+
+    if slow:
+        print(f"slower than {args.max_seconds}s: {', '.join(slow)}", file=sys.stderr)
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+Added *babelize init-many* and *babelize update-many* subcommands that
+render many projects at once across a process pool, sharing the on-disk
+template cache, and print a per-package summary of changed files, extra
+files, and errors.
@@ -0,0 +1,5 @@
+The *get_value* and *set_value* methods of generated C, C++, and Fortran
+wrappers now accept any object that supports the buffer protocol (memoryviews,
+*array.array*, *mmap*, shared memory, ...), not just NumPy arrays. Buffers
+are checked against the variable's type, layout, and size, and are copied
+only if they don't match.
@@ -0,0 +1,5 @@
+Added a ``[build.profile]`` section to *babel.toml* for choosing a
+*release*, *native* or *debug* build of the generated extensions. The
+profile sets the meson build type, link-time optimization, ``NDEBUG`` and
+(for *native*) ``-march=native`` in the generated *meson.build* and
+*pyproject.toml*.
@@ -0,0 +1,4 @@
+Added a ``[build.cython]`` section to *babel.toml* that sets the Cython
+compiler directives of the generated wrappers, either from a preset
+(*default* or *fast*) or one directive at a time. The wrappers are now
+also compiled with ``language_level=3``.
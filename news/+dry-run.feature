@@ -0,0 +1,4 @@
+Added a *--dry-run* option to *babelize update* that prints the changes an
+update would make as a diff, without writing anything. Projects are now
+rendered in memory, with the post-render steps applied to the rendered
+files, rather than in a temporary folder.
@@ -0,0 +1,9 @@
+The Fortran interoperability layer now keeps its model instances in a pool
+that grows as needed, rather than a fixed array of 2048 models. New instances
+are taken from a free list, and the slot of a finalized model is reused.
+The pool grows by adding chunks of slots and never moves the slots it
+already has, so models can be used without the GIL while new ones are
+created; creating and finalizing models always holds the GIL.
+Every function of the layer now checks that it was given the index of a
+live model, so using a model after *finalize* raises an error instead of
+dereferencing a released slot.
@@ -0,0 +1,4 @@
+Generated C, C++, and Fortran wrappers have new *get_values* and *set_values*
+methods that exchange several variables with a single call. All of the names
+are looked up and their buffers checked before any values are transferred,
+and the values are then transferred in one loop without returning to Python.
@@ -0,0 +1,5 @@
+The *get_value* method of generated C, C++, and Fortran wrappers now takes
+an optional *out* array. Without one, values are written into a buffer that
+is kept for each variable and reused on every call, so stepping a model does
+not allocate a new array each time. Pass *copy=True* to get an array that is
+not overwritten by later calls.
@@ -0,0 +1,4 @@
+Fixed *get_value_ptr* in the generated C wrapper so that it returns a
+writable, zero-copy view with the variable's data type and a length
+determined by the variable's number of bytes. Passing ``reshape=True``
+reshapes node variables on structured grids to the grid's shape.
@@ -0,0 +1,3 @@
+Generated packages now import their components when they are first used
+(PEP 562), so importing a package no longer loads every compiled
+extension or, for python libraries, every upstream model library.
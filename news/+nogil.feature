@@ -0,0 +1,4 @@
+Added a *nogil* option to the *library* section of *babel.toml*. When set,
+the generated C, C++, and Fortran wrappers release the GIL while the
+library runs and while values are copied, so that instances can be
+stepped concurrently from Python threads.
@@ -0,0 +1,5 @@
+Generated C, C++, and Fortran wrappers have a new *run* method that steps a
+model, for a number of steps or until a given time, without returning to
+Python. Recorded variables are collected after each step into a preallocated
+(n_steps, size) array for each variable. Use *run_chunks* to get the
+recorded values back every *chunk_size* steps instead of all at the end.
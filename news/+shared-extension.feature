@@ -0,0 +1,4 @@
+Moved the helpers that every generated Cython extension used to carry its
+own copy of (the ``VarInfo`` cache, buffer checks, dtype tables, ...) into
+a single ``lib/_shared`` extension that components ``cimport`` from. This
+makes packages with many components quicker to build and smaller.
@@ -0,0 +1,4 @@
+Added a ``single_extension`` option to the ``[build]`` section of
+*babel.toml* that builds all of a C or C++ package's components into one
+extension module, rather than one each. Components can still be imported
+from their own modules.
@@ -0,0 +1,4 @@
+*babelize update* now reads the package version from the project's
+*_version.py*, *pyproject.toml*, or git tags rather than running
+*python setup.py*. Use the new *--use-setup-py* option to fall back to
+*setup.py* when the version can't be found.
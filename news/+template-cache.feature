@@ -0,0 +1,3 @@
+The *babelizer* now keeps compiled templates in a cache under the user cache
+directory (or *BABELIZER_CACHE_DIR*), so repeated renders skip compiling
+templates.
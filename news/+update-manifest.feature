@@ -0,0 +1,2 @@
+*babelize update* now only writes files whose contents differ from those
+on disk, so that a no-op update doesn't trigger a rebuild of the package.
@@ -0,0 +1,7 @@
+Added *get_value_at_indices* and *set_value_at_indices* to the generated
+C, C++, and Fortran wrappers. Indices are zero-based and may be any
+integer array-like, and an index out of the variable's range raises an
+*IndexError*; values are gathered into, or scattered from, a
+dense buffer with one element per index. The destination buffer is
+optional and, like the source, is converted to the variable's type if
+it doesn't already match.
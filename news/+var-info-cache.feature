@@ -0,0 +1,6 @@
+Generated C, C++, and Fortran wrappers now cache each variable's type,
+item size, grid, size, number of bytes, and location the first time the
+variable is used after *initialize*. The data-transfer methods use the
+cache rather than querying the model on every call. Use *get_var_info* to
+inspect the cache and *invalidate_var_info* to clear it if a variable
+changes.
@@ -0,0 +1,4 @@
+Generated wrappers now fetch the input and output variable names once, the
+first time they are needed after *initialize*, and return the same interned
+tuples on every call. The new *get_input_var_index* and
+*get_output_var_index* methods look up a variable's position by name.
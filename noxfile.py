@@ -142,6 +142,48 @@ def test_cli(session: nox.Session) -> None:
             session.run("pre-commit", "run", "--all-files")
 
 
+@nox.session
+def bench(session: nox.Session) -> None:
+    """Benchmark rendering and updating projects.
+
+    Results are written to build/benchmarks.json. To check for regressions,
+    pass an earlier results file with ``-- --compare=<file>``.
+    """
+    session.install(".")
+    session.run(
+        "python",
+        "benchmarks/run.py",
+        f"--output={ROOT / 'build' / 'benchmarks.json'}",
+        *session.posargs,
+    )
+
+
+@nox.session(name="bench-startup")
+def bench_startup(session: nox.Session) -> None:
+    """Time how long the babelize command takes to start."""
+    session.install(".")
+    session.run(
+        "python",
+        "benchmarks/startup.py",
+        *(session.posargs or ["--repeat=20", "--max-seconds=0.5"]),
+    )
+
+
+@nox.session(name="bench-extensions", python=False)
+def bench_extensions(session: nox.Session) -> None:
+    """Compare building components as one extension each or as a single one.
+
+    This builds wheels, so it needs meson-python, a compiler and the example
+    libraries (see the build-examples session) to already be installed.
+    """
+    session.run(
+        "python",
+        "benchmarks/extensions.py",
+        f"--output={ROOT / 'build' / 'benchmarks-extensions.json'}",
+        *session.posargs,
+    )
+
+
 @nox.session
 def lint(session: nox.Session) -> None:
     """Look for lint."""
@@ -0,0 +1,440 @@
+"""Build a babelized C project against a small model and use its wrapper.
+
+These tests need a C compiler, meson, ninja, Cython, and the BMI C
+header (through the *bmic* pkg-config package); they are skipped if any
+of these are missing.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+
+if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
+    import tomllib
+else:  # pragma: no cover (<PY311)
+    import tomli as tomllib
+
+import pytest
+
+from babelizer.cli import SAMPLE_CONFIG
+from babelizer.config import BabelConfig
+from babelizer.render import render
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data", "counter")
+
+
+def _missing_tools():
+    missing = [
+        tool
+        for tool in ("cc", "ar", "meson", "ninja", "cython", "pkg-config")
+        if shutil.which(tool) is None
+    ]
+    if not missing:
+        try:
+            subprocess.run(["pkg-config", "--exists", "bmic"], check=True)
+        except subprocess.CalledProcessError:
+            missing.append("bmic")
+    return missing
+
+
+def run(*args, **kwds):
+    try:
+        return subprocess.run(
+            args,
+            check=True,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            **kwds,
+        )
+    except subprocess.CalledProcessError as err:
+        raise AssertionError(err.output) from None
+
+
+def build_model(prefix):
+    """Build the counter model as a static library, with a pkg-config file."""
+    for folder in ("include", "lib/pkgconfig", "build"):
+        os.makedirs(os.path.join(prefix, folder))
+    shutil.copy(os.path.join(DATA_DIR, "bmi_counter.h"), f"{prefix}/include")
+
+    cflags = run("pkg-config", "--cflags", "bmic").stdout.split()
+    run(
+        "cc",
+        "-c",
+        "-fPIC",
+        *cflags,
+        f"-I{prefix}/include",
+        "-o",
+        f"{prefix}/build/bmi_counter.o",
+        os.path.join(DATA_DIR, "bmi_counter.c"),
+    )
+    run("ar", "rcs", f"{prefix}/lib/libbmicounter.a", f"{prefix}/build/bmi_counter.o")
+
+    with open(os.path.join(prefix, "lib", "pkgconfig", "bmicounter.pc"), "w") as fp:
+        fp.write(
+            textwrap.dedent(
+                f"""\
+                prefix={prefix}
+                Name: bmicounter
+                Description: A model for testing babelized wrappers
+                Version: 0.1
+                Requires: bmic
+                Libs: -L${{prefix}}/lib -lbmicounter
+                Cflags: -I${{prefix}}/include
+                """
+            )
+        )
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory):
+    missing = _missing_tools()
+    if missing:
+        pytest.skip(f"missing build tools: {', '.join(missing)}")
+
+    root = tmp_path_factory.mktemp("build")
+    prefix = str(root / "prefix")
+    build_model(prefix)
+
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["library"] = {
+        "Counter": {
+            "language": "c",
+            "library": "bmicounter",
+            "header": "bmi_counter.h",
+            "entry_point": "register_bmi_counter",
+            "nogil": True,
+        }
+    }
+    meta["package"] = {"name": "pymt_counter", "requirements": []}
+    path = render(BabelConfig(**meta), str(root / "pymt_counter"))
+
+    env = os.environ | {
+        "PKG_CONFIG_PATH": os.pathsep.join(
+            [f"{prefix}/lib/pkgconfig", os.environ.get("PKG_CONFIG_PATH", "")]
+        )
+    }
+    run("meson", "setup", "build", cwd=path, env=env)
+    run("meson", "compile", "-C", "build", cwd=path, env=env)
+
+    for name in os.listdir(os.path.join(path, "build")):
+        if name.endswith((".so", ".pyd")):
+            shutil.copy(
+                os.path.join(path, "build", name),
+                os.path.join(path, "pymt_counter", "lib"),
+            )
+
+    return path
+
+
+def run_python(project, code):
+    """Run code that uses the wrapper in a new interpreter."""
+    return run(
+        sys.executable,
+        "-c",
+        "from pymt_counter import Counter\n"
+        "import numpy as np\n"
+        "model = Counter()\n"
+        "model.initialize('')\n" + textwrap.dedent(code),
+        env=os.environ | {"PYTHONPATH": project},
+    ).stdout
+
+
+def test_get_value_ptr(project):
+    output = run_python(
+        project,
+        """\
+        ptr = model.get_value_ptr("counter__value")
+        print(ptr.dtype, ptr.shape)
+        print(model.get_value_ptr("counter__value", reshape=True).shape)
+        print(model.get_value_ptr("counter__rate").dtype)
+        model.update()
+        print(ptr[:3])
+        """,
+    )
+    assert output.splitlines() == [
+        "float64 (12,)",
+        "(3, 4)",
+        "float32",
+        "[1. 2. 3.]",
+    ]
+
+
+def test_get_value_ptr_size_mismatch(project):
+    output = run_python(
+        project,
+        """\
+        try:
+            model.get_value_ptr("counter__bad_size")
+        except RuntimeError as err:
+            print(err)
+        """,
+    )
+    assert output.splitlines() == [
+        "counter__bad_size: size mismatch (type=float64, itemsize=4, nbytes=8)"
+    ]
+
+
+def test_value_at_indices(project):
+    output = run_python(
+        project,
+        """\
+        print(model.get_value_at_indices("counter__value", inds=[0, 5]))
+        out = np.empty(2, dtype=np.float32)
+        model.get_value_at_indices("counter__value", out, [1, 11])
+        print(out.dtype, out)
+        model.set_value_at_indices("counter__value", [0, 1], np.array([-1, -2]))
+        print(model.get_value("counter__value")[:3])
+        print(model.get_value_at_indices("counter__value", inds=[]))
+        """,
+    )
+    assert output.splitlines() == [
+        "[0. 5.]",
+        "float32 [ 1. 11.]",
+        "[-1. -2.  2.]",
+        "[]",
+    ]
+
+
+@pytest.mark.parametrize(
+    "call,error",
+    [
+        ('get_value_at_indices("counter__value", inds=[-1])', "IndexError"),
+        ('get_value_at_indices("counter__value", inds=[12])', "IndexError"),
+        ('get_value_at_indices("counter__value", inds=[2**32])', "IndexError"),
+        ('set_value_at_indices("counter__value", [-1], np.ones(1))', "IndexError"),
+        ('get_value_at_indices("counter__value", inds=[1.5])', "TypeError"),
+        (
+            'get_value_at_indices("counter__value", np.empty(1, dtype=int), [1])',
+            "TypeError",
+        ),
+        (
+            'get_value_at_indices("counter__value", np.empty(1), [1, 2])',
+            "ValueError",
+        ),
+        (
+            'set_value_at_indices("counter__count", [0], np.array([1.5]))',
+            "TypeError",
+        ),
+    ],
+)
+def test_value_at_indices_errors(project, call, error):
+    output = run_python(
+        project,
+        f"""\
+        try:
+            model.{call}
+        except Exception as err:
+            print(type(err).__name__)
+        print(model.get_current_time(), model.get_value("counter__value")[0])
+        """,
+    )
+    assert output.splitlines() == [error, "0.0 0.0"]
+
+
+def test_nogil_threads(project):
+    output = run_python(
+        project,
+        """\
+        from concurrent.futures import ThreadPoolExecutor
+
+        def step(n_steps):
+            counter = Counter()
+            counter.initialize("")
+            for _ in range(n_steps):
+                counter.update()
+            values = counter.get_value("counter__value", copy=True)
+            counter.finalize()
+            return float(values[0])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            print(list(executor.map(step, [1000, 2000, 3000, 4000])))
+        """,
+    )
+    assert output.splitlines() == ["[1000.0, 2000.0, 3000.0, 4000.0]"]
+
+
+def test_var_info_is_fetched_lazily(project):
+    output = run_python(
+        project,
+        """\
+        print(model.get_value("counter__count")[0])
+        try:
+            model.get_value("counter__bad_type")
+        except KeyError:
+            print("KeyError")
+
+        info = model.get_var_info("counter__value")
+        print(info.dtype, info.size, info.nbytes, info.location)
+        print(model.get_var_info("counter__value") is info)
+        model.invalidate_var_info("counter__value")
+        print(model.get_var_info("counter__value") is info)
+        """,
+    )
+    assert output.splitlines() == [
+        "0",
+        "KeyError",
+        "float64 12 96 node",
+        "True",
+        "False",
+    ]
+
+
+def test_var_names(project):
+    output = run_python(
+        project,
+        """\
+        names = model.get_input_var_names()
+        print(names)
+        print(model.get_input_var_names() is names)
+        print(model.get_output_var_names()[-1])
+        print(model.get_input_var_index("counter__count"))
+        print(model.get_output_var_index("counter__rate"))
+        model.initialize("")
+        print(model.get_input_var_names() is names)
+        """,
+    )
+    assert output.splitlines() == [
+        "('counter__value', 'counter__count')",
+        "True",
+        "counter__bad_type",
+        "1",
+        "2",
+        "False",
+    ]
+
+
+def test_get_value_buffers(project):
+    output = run_python(
+        project,
+        """\
+        first = model.get_value("counter__value")
+        print(model.get_value("counter__value") is first)
+        copied = model.get_value("counter__value", copy=True)
+        print(copied is first, copied.dtype, copied.shape)
+        model.update()
+        model.get_value("counter__value")
+        print(first[1], copied[1])
+        try:
+            model.get_value("counter__bad_size")
+        except RuntimeError as err:
+            print(err)
+        """,
+    )
+    assert output.splitlines() == [
+        "True",
+        "False float64 (12,)",
+        "2.0 1.0",
+        "counter__bad_size: size mismatch (type=float64, itemsize=4, nbytes=8)",
+    ]
+
+
+def test_buffer_protocol(project):
+    output = run_python(
+        project,
+        """\
+        import array
+
+        out = bytearray(12 * 8)
+        model.get_value("counter__value", out)
+        print(np.frombuffer(out)[:3])
+
+        out = array.array("f", bytes(5 * 4))
+        model.get_value("counter__rate", out)
+        print(out[1])
+
+        out = np.zeros((12, 2))[:, 0]
+        model.get_value("counter__value", out)
+        print(out[:3])
+
+        model.set_value("counter__value", np.arange(12, dtype=np.int32))
+        print(model.get_value("counter__value")[-1])
+        model.set_value("counter__value", memoryview(np.ones(12)))
+        print(model.get_value("counter__value")[-1])
+
+        for call in (
+            lambda: model.set_value("counter__count", np.array([1.5])),
+            lambda: model.get_value("counter__value", np.empty(12, dtype=int)),
+            lambda: model.get_value("counter__value", np.empty(11)),
+            lambda: model.get_value("counter__value", bytes(12 * 8)),
+        ):
+            try:
+                call()
+            except (TypeError, ValueError) as err:
+                print(type(err).__name__)
+        """,
+    )
+    assert output.splitlines() == [
+        "[0. 1. 2.]",
+        "0.5",
+        "[0. 1. 2.]",
+        "11.0",
+        "1.0",
+        "TypeError",
+        "TypeError",
+        "ValueError",
+        "ValueError",
+    ]
+
+
+def test_get_set_values(project):
+    output = run_python(
+        project,
+        """\
+        model.set_values(
+            {"counter__count": np.array([5]), "counter__value": np.ones(12)}
+        )
+        values = model.get_values(["counter__count", "counter__rate"])
+        print(sorted(values), values["counter__count"], values["counter__rate"][1])
+
+        out = {"counter__value": np.empty(12, dtype=np.float32)}
+        array = out["counter__value"]
+        print(model.get_values(["counter__value"], out)["counter__value"] is array)
+        print(array.dtype, array[0])
+
+        try:
+            model.set_values(
+                {"counter__count": np.array([6]), "counter__value": np.full(12, 1j)}
+            )
+        except TypeError:
+            print("TypeError", model.get_value("counter__count")[0])
+        """,
+    )
+    assert output.splitlines() == [
+        "['counter__count', 'counter__rate'] [5] 0.5",
+        "True",
+        "float32 1.0",
+        "TypeError 5",
+    ]
+
+
+def test_run(project):
+    output = run_python(
+        project,
+        """\
+        out = model.run(n_steps=3, record=["counter__value", "counter__count"])
+        print(out["counter__value"].shape, out["counter__value"][:, 0])
+        print(out["counter__count"].ravel())
+        out = model.run(until=5.5, record=["counter__count"])
+        print(out["counter__count"].ravel(), model.get_current_time())
+
+        chunks = model.run_chunks(2, n_steps=5, record=["counter__count"])
+        print([chunk["counter__count"].ravel().tolist() for chunk in chunks])
+
+        try:
+            model.run(n_steps=2, record=["counter__bad_size"])
+        except RuntimeError as err:
+            print(err)
+        print(model.get_current_time())
+        """,
+    )
+    assert output.splitlines() == [
+        "(3, 12) [1. 2. 3.]",
+        "[1 2 3]",
+        "[4 5 6] 6.0",
+        "[[7, 8], [9, 10], [11]]",
+        "counter__bad_size: size mismatch (type=float64, itemsize=4, nbytes=8)",
+        "11.0",
+    ]
@@ -1,5 +1,6 @@
 """Test the babelizer command-line interface"""
 
+import subprocess
 import sys
 
 if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
@@ -7,8 +8,10 @@ if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
 else:  # pragma: no cover (<PY311)
     import tomli as tomllib
 
+import git
 from click.testing import CliRunner
 
+from babelizer.cli import SAMPLE_CONFIG
 from babelizer.cli import babelize
 from babelizer.config import BabelConfig
 
@@ -34,6 +37,18 @@ def test_defaults():
     assert "Usage:" in result.output
 
 
+def test_startup_does_not_import_heavy_modules():
+    heavy = ["git", "jinja2", "logoizer", "matplotlib", "tomli_w", "yaml"]
+    code = (
+        "import sys; import babelizer.cli;"
+        f" print(' '.join(sorted(set({heavy!r}) & set(sys.modules))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == []
+
+
 def test_generate_help():
     runner = CliRunner()
     result = runner.invoke(babelize, ["sample-config", "--help"])
@@ -80,3 +95,65 @@ def test_update_noargs():
     runner = CliRunner()
     result = runner.invoke(babelize, ["update"])
     assert result.exit_code != 0
+
+
+def test_update_reports_extra_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "babel.toml").write_text(SAMPLE_CONFIG)
+
+    runner = CliRunner()
+    result = runner.invoke(babelize, ["init", "babel.toml"])
+    assert result.exit_code == 0
+
+    (tmp_path / "springfield_monorail" / "extra.txt").write_text("not generated")
+    repo = git.Repo(tmp_path / "springfield_monorail")
+    repo.index.add(["extra.txt"])
+    repo.index.commit("Add a file")
+
+    result = runner.invoke(
+        babelize,
+        ["--cd", "springfield_monorail", "update", "--set-version=0.1"],
+    )
+    assert result.exit_code == 0
+    assert "found extra files" in result.output
+    assert "extra.txt" in result.output
+    assert "babel.toml" not in result.output
+
+
+def test_update_many_summary(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "babel.toml").write_text(SAMPLE_CONFIG)
+
+    runner = CliRunner()
+    result = runner.invoke(babelize, ["init-many", "babel.toml"])
+    assert result.exit_code == 0
+    assert "created" in result.output
+
+    (tmp_path / "not_a_package").mkdir()
+    result = runner.invoke(
+        babelize,
+        ["update-many", "--set-version=0.1", "springfield_monorail", "not_a_package"],
+    )
+    assert result.exit_code == 1
+    assert "springfield_monorail: 0 files changed" in result.output
+    assert "not_a_package: error:" in result.output
+
+
+def test_update_dry_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "babel.toml").write_text(SAMPLE_CONFIG)
+
+    runner = CliRunner()
+    result = runner.invoke(babelize, ["init", "babel.toml"])
+    assert result.exit_code == 0
+
+    version_py = tmp_path / "springfield_monorail/springfield_monorail/_version.py"
+    version_py.write_text('__version__ = "0.1"\n# edited\n')
+
+    result = runner.invoke(
+        babelize, ["--cd", "springfield_monorail", "update", "--dry-run"]
+    )
+    assert result.exit_code == 0
+    assert "--- a/springfield_monorail/_version.py" in result.output
+    assert "-# edited" in result.output
+    assert version_py.read_text() == '__version__ = "0.1"\n# edited\n'
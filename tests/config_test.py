@@ -0,0 +1,172 @@
+"""Test the babelizer configuration"""
+
+import sys
+
+if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
+    import tomllib
+else:  # pragma: no cover (<PY311)
+    import tomli as tomllib
+
+import pytest
+import tomli_w
+
+from babelizer.cli import SAMPLE_CONFIG
+from babelizer.config import BabelConfig
+from babelizer.errors import ValidationError
+
+
+def test_nogil_default():
+    config = BabelConfig(**tomllib.loads(SAMPLE_CONFIG))
+    assert "nogil" not in config["library"]["Monorail"]
+    assert "nogil" not in config.format(fmt="toml")
+
+
+def test_nogil():
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["library"]["Monorail"]["nogil"] = True
+
+    config = BabelConfig(**meta)
+    assert config["library"]["Monorail"]["nogil"] is True
+    assert config["components"]["Monorail"]["nogil"] is True
+
+
+@pytest.mark.parametrize("value", ["yes", 1])
+def test_nogil_not_a_bool(value):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["library"]["Monorail"]["nogil"] = value
+
+    with pytest.raises(ValidationError):
+        BabelConfig(**meta)
+
+
+def test_dump_round_trip(tmp_path):
+    config = BabelConfig(**tomllib.loads(SAMPLE_CONFIG))
+
+    with open(tmp_path / "babel.toml", "w") as fp:
+        config.dump(fp, fmt="toml")
+    dumped = tomllib.loads((tmp_path / "babel.toml").read_text())
+
+    assert "components" not in dumped
+    assert "language" not in dumped
+    assert dict(BabelConfig.from_path(str(tmp_path / "babel.toml"))) == dict(config)
+
+
+def test_load_ignores_derived_keys(tmp_path):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["language"] = "c"
+    meta["components"] = meta["library"]
+    (tmp_path / "babel.toml").write_text(tomli_w.dumps(meta))
+
+    config = BabelConfig.from_path(str(tmp_path / "babel.toml"))
+    assert config["components"] == config["library"]
+
+
+def test_build_profile_default():
+    config = BabelConfig(**tomllib.loads(SAMPLE_CONFIG))
+    assert "profile" not in config["build"]
+    assert config.build_profile() == {}
+
+
+@pytest.mark.parametrize("profile", ["native", {"name": "native"}])
+def test_build_profile(profile):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["profile"] = profile
+
+    config = BabelConfig(**meta)
+    assert config.build_profile() == {
+        "name": "native",
+        "buildtype": "release",
+        "ndebug": True,
+        "lto": True,
+        "native": True,
+    }
+
+
+def test_build_profile_override():
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["profile"] = {"name": "release", "lto": False}
+
+    config = BabelConfig(**meta)
+    assert config.build_profile()["lto"] is False
+    assert config.build_profile()["buildtype"] == "release"
+    assert tomllib.loads(config.format())["build"]["profile"] == {
+        "name": "release",
+        "lto": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "profile",
+    [
+        "fast",
+        {"lto": True},
+        {"name": "release", "lto": "yes"},
+        {"name": "release", "buildtype": "fast"},
+        {"name": "release", "march": "native"},
+        1,
+    ],
+)
+def test_build_profile_invalid(profile):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["profile"] = profile
+
+    with pytest.raises(ValidationError):
+        BabelConfig(**meta)
+
+
+def test_cython_directives_default():
+    config = BabelConfig(**tomllib.loads(SAMPLE_CONFIG))
+    assert config.cython_directives() == {}
+
+
+@pytest.mark.parametrize("cython", ["fast", {"preset": "fast"}])
+def test_cython_directives_fast(cython):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["cython"] = cython
+
+    directives = BabelConfig(**meta).cython_directives()
+    assert directives["boundscheck"] is False
+    assert directives["wraparound"] is False
+    assert directives["cdivision"] is True
+
+
+def test_cython_directives_override():
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["cython"] = {"preset": "fast", "boundscheck": True}
+
+    directives = BabelConfig(**meta).cython_directives()
+    assert directives["boundscheck"] is True
+    assert directives["wraparound"] is False
+
+
+@pytest.mark.parametrize(
+    "cython",
+    ["fastest", {"preset": "fast", "boundscheck": 0}, {"profile": True}, []],
+)
+def test_cython_directives_invalid(cython):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["cython"] = cython
+
+    with pytest.raises(ValidationError):
+        BabelConfig(**meta)
+
+
+def test_single_extension():
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["single_extension"] = True
+
+    assert BabelConfig(**meta)["build"]["single_extension"] is True
+
+    config = BabelConfig(**tomllib.loads(SAMPLE_CONFIG))
+    assert "single_extension" not in config["build"]
+
+
+@pytest.mark.parametrize("language,single", [("c", "yes"), ("fortran", True)])
+def test_single_extension_invalid(language, single):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["single_extension"] = single
+    for library in meta["library"].values():
+        library["language"] = language
+
+    with pytest.raises(ValidationError):
+        BabelConfig(**meta)
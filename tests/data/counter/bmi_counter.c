@@ -0,0 +1,419 @@
+/*
+ * A small BMI model used to test babelized wrappers.
+ *
+ * "counter__value" is a 3x4 grid of doubles that starts at 0, 1, ..., 11
+ * and goes up by one each step, "counter__count" is the number of steps
+ * taken and "counter__rate" is a float on each of 5 edges. The model also
+ * reports two broken variables: "counter__bad_size", whose item size
+ * doesn't match its type, and "counter__bad_type", whose type is unknown.
+ */
+#include <stdlib.h>
+#include <string.h>
+
+#include "bmi_counter.h"
+
+#define N_VALUES 12
+#define N_RATES 5
+
+typedef struct {
+  double time;
+  double value[N_VALUES];
+  int count;
+  float rate[N_RATES];
+  double bad[2];
+} Counter;
+
+enum { VALUE, COUNT, RATE, BAD_SIZE, BAD_TYPE, N_VARS };
+
+static const char *NAMES[N_VARS] = {
+  "counter__value", "counter__count", "counter__rate",
+  "counter__bad_size", "counter__bad_type",
+};
+static const char *TYPES[N_VARS] = {"double", "int", "float", "double", "complex"};
+static const int ITEMSIZES[N_VARS] = {8, 4, 4, 4, 16};
+static const int NBYTES[N_VARS] = {96, 4, 20, 8, 16};
+static const int GRIDS[N_VARS] = {0, 1, 2, 1, 1};
+static const char *LOCATIONS[N_VARS] = {"node", "node", "edge", "node", "node"};
+
+#define N_INPUTS 2
+
+static int
+find_var(const char *name)
+{
+  int i;
+  for (i = 0; i < N_VARS; i++)
+    if (strcmp(name, NAMES[i]) == 0)
+      return i;
+  return -1;
+}
+
+static void *
+var_data(Bmi *self, int var)
+{
+  Counter *counter = (Counter *)self->data;
+  switch (var) {
+    case VALUE: return counter->value;
+    case COUNT: return &counter->count;
+    case RATE: return counter->rate;
+    case BAD_SIZE: return counter->bad;
+    default: return NULL;
+  }
+}
+
+static int
+initialize(Bmi *self, const char *config_file)
+{
+  Counter *counter = calloc(1, sizeof(Counter));
+  int i;
+
+  if (!counter)
+    return BMI_FAILURE;
+  for (i = 0; i < N_VALUES; i++)
+    counter->value[i] = i;
+  for (i = 0; i < N_RATES; i++)
+    counter->rate[i] = .5f * i;
+  self->data = counter;
+  return BMI_SUCCESS;
+}
+
+static int
+update(Bmi *self)
+{
+  Counter *counter = (Counter *)self->data;
+  int i;
+
+  counter->time += 1.;
+  counter->count += 1;
+  for (i = 0; i < N_VALUES; i++)
+    counter->value[i] += 1.;
+  return BMI_SUCCESS;
+}
+
+static int
+update_until(Bmi *self, double then)
+{
+  while (((Counter *)self->data)->time < then)
+    update(self);
+  return BMI_SUCCESS;
+}
+
+static int
+finalize(Bmi *self)
+{
+  free(self->data);
+  self->data = NULL;
+  return BMI_SUCCESS;
+}
+
+static int
+get_component_name(Bmi *self, char *name)
+{
+  strcpy(name, "Counter");
+  return BMI_SUCCESS;
+}
+
+static int
+get_input_item_count(Bmi *self, int *count)
+{
+  *count = N_INPUTS;
+  return BMI_SUCCESS;
+}
+
+static int
+get_output_item_count(Bmi *self, int *count)
+{
+  *count = N_VARS;
+  return BMI_SUCCESS;
+}
+
+static int
+get_input_var_names(Bmi *self, char **names)
+{
+  int i;
+  for (i = 0; i < N_INPUTS; i++)
+    strcpy(names[i], NAMES[i]);
+  return BMI_SUCCESS;
+}
+
+static int
+get_output_var_names(Bmi *self, char **names)
+{
+  int i;
+  for (i = 0; i < N_VARS; i++)
+    strcpy(names[i], NAMES[i]);
+  return BMI_SUCCESS;
+}
+
+static int
+get_var_grid(Bmi *self, const char *name, int *grid)
+{
+  int var = find_var(name);
+  if (var < 0)
+    return BMI_FAILURE;
+  *grid = GRIDS[var];
+  return BMI_SUCCESS;
+}
+
+static int
+get_var_type(Bmi *self, const char *name, char *type)
+{
+  int var = find_var(name);
+  if (var < 0)
+    return BMI_FAILURE;
+  strcpy(type, TYPES[var]);
+  return BMI_SUCCESS;
+}
+
+static int
+get_var_units(Bmi *self, const char *name, char *units)
+{
+  strcpy(units, "1");
+  return BMI_SUCCESS;
+}
+
+static int
+get_var_itemsize(Bmi *self, const char *name, int *size)
+{
+  int var = find_var(name);
+  if (var < 0)
+    return BMI_FAILURE;
+  *size = ITEMSIZES[var];
+  return BMI_SUCCESS;
+}
+
+static int
+get_var_nbytes(Bmi *self, const char *name, int *nbytes)
+{
+  int var = find_var(name);
+  if (var < 0)
+    return BMI_FAILURE;
+  *nbytes = NBYTES[var];
+  return BMI_SUCCESS;
+}
+
+static int
+get_var_location(Bmi *self, const char *name, char *location)
+{
+  int var = find_var(name);
+  if (var < 0)
+    return BMI_FAILURE;
+  strcpy(location, LOCATIONS[var]);
+  return BMI_SUCCESS;
+}
+
+static int
+get_current_time(Bmi *self, double *time)
+{
+  *time = ((Counter *)self->data)->time;
+  return BMI_SUCCESS;
+}
+
+static int
+get_start_time(Bmi *self, double *time)
+{
+  *time = 0.;
+  return BMI_SUCCESS;
+}
+
+static int
+get_end_time(Bmi *self, double *time)
+{
+  *time = 100.;
+  return BMI_SUCCESS;
+}
+
+static int
+get_time_units(Bmi *self, char *units)
+{
+  strcpy(units, "s");
+  return BMI_SUCCESS;
+}
+
+static int
+get_time_step(Bmi *self, double *time_step)
+{
+  *time_step = 1.;
+  return BMI_SUCCESS;
+}
+
+static int
+get_value_ptr(Bmi *self, const char *name, void **dest)
+{
+  void *data = var_data(self, find_var(name));
+  if (!data)
+    return BMI_FAILURE;
+  *dest = data;
+  return BMI_SUCCESS;
+}
+
+static int
+get_value(Bmi *self, const char *name, void *dest)
+{
+  int var = find_var(name);
+  void *data = var_data(self, var);
+  if (!data)
+    return BMI_FAILURE;
+  memcpy(dest, data, NBYTES[var]);
+  return BMI_SUCCESS;
+}
+
+static int
+set_value(Bmi *self, const char *name, void *src)
+{
+  int var = find_var(name);
+  void *data = var_data(self, var);
+  if (!data)
+    return BMI_FAILURE;
+  memcpy(data, src, NBYTES[var]);
+  return BMI_SUCCESS;
+}
+
+static int
+get_value_at_indices(Bmi *self, const char *name, void *dest, int *inds, int count)
+{
+  int var = find_var(name);
+  char *data = var_data(self, var);
+  int i;
+  if (!data)
+    return BMI_FAILURE;
+  for (i = 0; i < count; i++)
+    memcpy((char *)dest + i * ITEMSIZES[var], data + inds[i] * ITEMSIZES[var],
+           ITEMSIZES[var]);
+  return BMI_SUCCESS;
+}
+
+static int
+set_value_at_indices(Bmi *self, const char *name, int *inds, int count, void *src)
+{
+  int var = find_var(name);
+  char *data = var_data(self, var);
+  int i;
+  if (!data)
+    return BMI_FAILURE;
+  for (i = 0; i < count; i++)
+    memcpy(data + inds[i] * ITEMSIZES[var], (char *)src + i * ITEMSIZES[var],
+           ITEMSIZES[var]);
+  return BMI_SUCCESS;
+}
+
+static int
+get_grid_rank(Bmi *self, int grid, int *rank)
+{
+  *rank = grid == 0 ? 2 : grid == 1 ? 0 : 1;
+  return BMI_SUCCESS;
+}
+
+static int
+get_grid_size(Bmi *self, int grid, int *size)
+{
+  *size = grid == 0 ? N_VALUES : grid == 1 ? 1 : N_RATES;
+  return BMI_SUCCESS;
+}
+
+static int
+get_grid_type(Bmi *self, int grid, char *type)
+{
+  strcpy(type, grid == 0 ? "uniform_rectilinear" : grid == 1 ? "scalar" : "unstructured");
+  return BMI_SUCCESS;
+}
+
+static int
+get_grid_shape(Bmi *self, int grid, int *shape)
+{
+  if (grid != 0)
+    return BMI_FAILURE;
+  shape[0] = 3;
+  shape[1] = 4;
+  return BMI_SUCCESS;
+}
+
+static int
+get_grid_spacing(Bmi *self, int grid, double *spacing)
+{
+  if (grid != 0)
+    return BMI_FAILURE;
+  spacing[0] = spacing[1] = 1.;
+  return BMI_SUCCESS;
+}
+
+static int
+get_grid_origin(Bmi *self, int grid, double *origin)
+{
+  if (grid != 0)
+    return BMI_FAILURE;
+  origin[0] = origin[1] = 0.;
+  return BMI_SUCCESS;
+}
+
+static int
+get_grid_coordinates(Bmi *self, int grid, double *coordinates)
+{
+  return BMI_FAILURE;
+}
+
+static int
+get_grid_count(Bmi *self, int grid, int *count)
+{
+  return BMI_FAILURE;
+}
+
+static int
+get_grid_connectivity(Bmi *self, int grid, int *connectivity)
+{
+  return BMI_FAILURE;
+}
+
+Bmi *
+register_bmi_counter(Bmi *model)
+{
+  model->data = NULL;
+
+  model->initialize = initialize;
+  model->update = update;
+  model->update_until = update_until;
+  model->finalize = finalize;
+
+  model->get_component_name = get_component_name;
+  model->get_input_item_count = get_input_item_count;
+  model->get_output_item_count = get_output_item_count;
+  model->get_input_var_names = get_input_var_names;
+  model->get_output_var_names = get_output_var_names;
+
+  model->get_var_grid = get_var_grid;
+  model->get_var_type = get_var_type;
+  model->get_var_units = get_var_units;
+  model->get_var_itemsize = get_var_itemsize;
+  model->get_var_nbytes = get_var_nbytes;
+  model->get_var_location = get_var_location;
+
+  model->get_current_time = get_current_time;
+  model->get_start_time = get_start_time;
+  model->get_end_time = get_end_time;
+  model->get_time_units = get_time_units;
+  model->get_time_step = get_time_step;
+
+  model->get_value = get_value;
+  model->get_value_ptr = get_value_ptr;
+  model->get_value_at_indices = get_value_at_indices;
+  model->set_value = set_value;
+  model->set_value_at_indices = set_value_at_indices;
+
+  model->get_grid_rank = get_grid_rank;
+  model->get_grid_size = get_grid_size;
+  model->get_grid_type = get_grid_type;
+  model->get_grid_shape = get_grid_shape;
+  model->get_grid_spacing = get_grid_spacing;
+  model->get_grid_origin = get_grid_origin;
+  model->get_grid_x = get_grid_coordinates;
+  model->get_grid_y = get_grid_coordinates;
+  model->get_grid_z = get_grid_coordinates;
+  model->get_grid_node_count = get_grid_count;
+  model->get_grid_edge_count = get_grid_count;
+  model->get_grid_face_count = get_grid_count;
+  model->get_grid_edge_nodes = get_grid_connectivity;
+  model->get_grid_face_edges = get_grid_connectivity;
+  model->get_grid_face_nodes = get_grid_connectivity;
+  model->get_grid_nodes_per_face = get_grid_connectivity;
+
+  return model;
+}
@@ -0,0 +1,9 @@
+#ifndef BMI_COUNTER_H
+#define BMI_COUNTER_H
+
+#include "bmi.h"
+
+/* A small model, used to test babelized wrappers, that counts its time steps. */
+Bmi *register_bmi_counter(Bmi *model);
+
+#endif
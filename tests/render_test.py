@@ -0,0 +1,153 @@
+"""Test rendering a babelized project"""
+
+import os
+import subprocess
+import sys
+
+if sys.version_info >= (3, 11):  # pragma: no cover (PY11+)
+    import tomllib
+else:  # pragma: no cover (<PY311)
+    import tomli as tomllib
+
+import pytest
+
+from babelizer.cli import SAMPLE_CONFIG
+from babelizer.config import BabelConfig
+from babelizer.errors import OutputDirExistsError
+from babelizer.render import render
+from babelizer.render import render_files
+
+
+@pytest.fixture
+def babel_config():
+    return BabelConfig(**tomllib.loads(SAMPLE_CONFIG))
+
+
+def test_render_existing_without_clobber(tmp_path, babel_config):
+    with pytest.raises(OutputDirExistsError):
+        render(babel_config, str(tmp_path))
+
+
+def test_rerender_leaves_unchanged_files(tmp_path, babel_config):
+    path = render(babel_config, str(tmp_path / "project"))
+    files, _ = render_files(babel_config)
+
+    for rel_path in files:
+        os.utime(os.path.join(path, rel_path), (0, 0))
+    with open(os.path.join(path, "README.rst"), "a") as fp:
+        fp.write("local change\n")
+
+    render(babel_config, path, clobber=True)
+
+    modified = {
+        rel_path
+        for rel_path in files
+        if os.stat(os.path.join(path, rel_path)).st_mtime != 0
+    }
+    assert modified == {"README.rst"}
+
+
+def test_logos_are_cached(tmp_path, monkeypatch, babel_config):
+    monkeypatch.setenv("BABELIZER_CACHE_DIR", str(tmp_path / "cache"))
+    first = render(babel_config, str(tmp_path / "first"))
+
+    def fail(*args, **kwds):
+        raise AssertionError("logo was redrawn")
+
+    monkeypatch.setattr("babelizer._post_hook.make_logo", fail)
+    second = render(babel_config, str(tmp_path / "second"))
+
+    for logo in ("logo-light.svg", "logo-dark.svg"):
+        with open(os.path.join(first, "docs", "_static", logo)) as fp:
+            expected = fp.read()
+        with open(os.path.join(second, "docs", "_static", logo)) as fp:
+            assert fp.read() == expected
+
+
+def test_render_files_in_memory(tmp_path, monkeypatch, babel_config):
+    monkeypatch.chdir(tmp_path)
+    files, links = render_files(babel_config)
+
+    assert list(tmp_path.iterdir()) == []
+    assert links == {"springfield_monorail/data": "../meta"}
+    assert "springfield_monorail/lib/_c.pyx" not in files
+    assert files["babel.toml"].decode() == babel_config.format(fmt="toml")
+
+
+def test_render_cython_directives(babel_config):
+    files, _ = render_files(babel_config)
+    header = files["springfield_monorail/lib/monorail.pyx"].decode().splitlines()[0]
+    assert header.startswith("# cython: language_level=3,")
+    assert "boundscheck" not in header
+
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["build"]["cython"] = {"preset": "fast"}
+    files, _ = render_files(BabelConfig(**meta))
+    header = files["springfield_monorail/lib/monorail.pyx"].decode().splitlines()[0]
+    assert "boundscheck=False" in header
+    assert "wraparound=False" in header
+
+
+@pytest.mark.parametrize("language", ["c", "c++", "fortran"])
+def test_render_shared_extension(language):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    for library in meta["library"].values():
+        library["language"] = language
+    files, _ = render_files(BabelConfig(**meta))
+
+    lib = "springfield_monorail/lib"
+    assert f"{lib}/_shared.pxd" in files
+    assert "cdef class VarInfo:" in files[f"{lib}/_shared.pyx"].decode()
+
+    component = files[f"{lib}/monorail.pyx"].decode()
+    assert "from ._shared cimport VarInfo" in component
+    assert "cdef class VarInfo" not in component
+    assert "'_shared'" in files["meson.build"].decode()
+
+
+def test_render_single_extension():
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["library"]["Rail"] = dict(meta["library"]["Monorail"])
+    meta["build"]["single_extension"] = True
+    files, _ = render_files(BabelConfig(**meta))
+
+    lib = "springfield_monorail/lib"
+    assert f"{lib}/monorail.pyx" not in files
+    components = files[f"{lib}/_components.pyx"].decode()
+    assert "cdef class Monorail:" in components
+    assert "cdef class Rail:" in components
+    assert components.count("from ._shared cimport VarInfo") == 1
+
+    rail = files[f"{lib}/rail.py"].decode()
+    assert rail.startswith("from ._components import Rail\n")
+    assert '"Monorail": "_components"' in files[f"{lib}/__init__.py"].decode()
+    assert files["meson.build"].decode().count("py.extension_module(") == 2
+
+
+def test_render_lazy_components(tmp_path):
+    meta = tomllib.loads(SAMPLE_CONFIG)
+    meta["library"] = {
+        "Monorail": {
+            "language": "python",
+            "library": "springfield_rail",
+            "header": "",
+            "entry_point": "Rail",
+        }
+    }
+    path = render(BabelConfig(**meta), str(tmp_path / "project"))
+    (tmp_path / "springfield_rail.py").write_text("class Rail:\n    pass\n")
+
+    code = """\
+import sys
+import springfield_monorail
+print("springfield_rail" in sys.modules)
+print(springfield_monorail.Monorail.__name__, "springfield_rail" in sys.modules)
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ | {"PYTHONPATH": os.pathsep.join([path, str(tmp_path)])},
+    )
+    assert result.stdout.splitlines() == ["False", "Monorail True"]
@@ -0,0 +1,38 @@
+"""Test babelizer utilities"""
+
+import pytest
+
+from babelizer._utils import get_package_version
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pymt_foo").mkdir()
+    return tmp_path
+
+
+def test_version_from_version_py(project):
+    (project / "pymt_foo" / "_version.py").write_text('__version__ = "1.2.3"\n')
+    (project / "pyproject.toml").write_text('[project]\nversion = "0.0.1"\n')
+    assert get_package_version("pymt_foo") == "1.2.3"
+
+
+def test_version_from_pyproject(project):
+    (project / "pyproject.toml").write_text('[project]\nversion = "0.0.1"\n')
+    assert get_package_version("pymt_foo") == "0.0.1"
+
+
+def test_version_from_git_tags(project):
+    tags = project / ".git" / "refs" / "tags"
+    tags.mkdir(parents=True)
+    for tag in ("v0.9", "v0.10.1", "not-a-release", "v1.0rc1"):
+        (tags / tag).write_text("0" * 40 + "\n")
+    (project / ".git" / "packed-refs").write_text(
+        f"# pack-refs with: peeled\n{'0' * 40} refs/tags/v0.2\n"
+    )
+    assert get_package_version("pymt_foo") == "0.10.1"
+
+
+def test_version_not_found(project):
+    assert get_package_version("pymt_foo") is None